@@ -0,0 +1,2 @@
+"""Motorul de Texas Hold'em, fără Streamlit: cărți, pachet, evaluare, showdown și
+starea unei mâini (holdem.game). pkr-tx-h.py e doar stratul de UI peste el."""
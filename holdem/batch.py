@@ -0,0 +1,105 @@
+import numpy as np
+
+from .evaluator import FLUSH_TABLE, ensure_tables
+
+# ===== Evaluare vectorizată (NumPy) =====
+# Aceleași scoruri întregi ca evaluator.evaluate(), dar pentru N mâini deodată:
+# histograme de ranguri/culori + măști de 13 biți, fără buclă Python per mână.
+CHUNK = 1 << 16
+
+_MASKS = np.arange(1 << 13, dtype=np.int64)
+
+def _top_bits_table(k):
+    # TOPk[m] = primele k valori (2..14) din mască, împachetate pe câte 4 biți
+    out = np.zeros(1 << 13, dtype=np.int64)
+    m = _MASKS.copy()
+    for _ in range(k):
+        hb = np.zeros_like(m)
+        nz = m > 0
+        hb[nz] = np.floor(np.log2(m[nz])).astype(np.int64)
+        val = np.where(nz, hb + 2, 0)
+        out = (out << 4) | val
+        m = np.where(nz, m & ~(1 << hb), 0)
+    return out
+
+HIGH = _top_bits_table(1)   # cea mai mare valoare din mască (0 dacă e goală)
+TOP2 = _top_bits_table(2)
+TOP3 = _top_bits_table(3)
+TOP5 = _top_bits_table(5)
+ensure_tables()  # batch se importă doar când urmează evaluări
+FLUSH = np.asarray(FLUSH_TABLE, dtype=np.int64)
+POW2 = 1 << np.arange(13, dtype=np.int64)
+
+def _bit(v):
+    # bitul rangului cu valoarea v (2..14); 0 dacă v == 0
+    return np.where(v > 0, 1 << np.maximum(v - 2, 0), 0)
+
+def _straight_top(mask):
+    # asul intră și ca bit 0 (A-2-3-4-5); 5 biți consecutivi = chintă
+    ext = (mask << 1) | ((mask >> 12) & 1)
+    run = ext & (ext >> 1) & (ext >> 2) & (ext >> 3) & (ext >> 4)
+    return np.where(run > 0, HIGH[run & 0x1FFF] + 3, 0)
+
+def _evaluate_chunk(cards):
+    n, k = cards.shape
+    rows = np.repeat(np.arange(n, dtype=np.int64), k)
+    ranks = (cards >> 2).ravel()
+    suits = (cards & 3).ravel()
+
+    rc = np.bincount(rows * 13 + ranks, minlength=n * 13).reshape(n, 13)
+    sc = np.bincount(rows * 4 + suits, minlength=n * 4).reshape(n, 4)
+    smask = np.bincount(rows * 4 + suits, weights=POW2[ranks], minlength=n * 4).reshape(n, 4).astype(np.int64)
+
+    m1 = (rc >= 1) @ POW2
+    m2 = (rc >= 2) @ POW2
+    m3 = (rc >= 3) @ POW2
+    m4 = (rc == 4) @ POW2
+
+    fsuit = sc.argmax(axis=1)
+    has_flush = sc[np.arange(n), fsuit] >= 5
+    flush = FLUSH[smask[np.arange(n), fsuit]]
+
+    q = HIGH[m4]
+    quads = (7 << 20) | (q << 16) | (HIGH[m1 & ~_bit(q)] << 12)
+
+    t = HIGH[m3]
+    full_pair = HIGH[m2 & ~_bit(t)]
+    full = (6 << 20) | (t << 16) | (full_pair << 12)
+
+    top = _straight_top(m1)
+    straight = (4 << 20) | (top << 16)
+
+    trips = (3 << 20) | (t << 16) | (TOP2[m1 & ~_bit(t)] << 8)
+
+    p1 = HIGH[m2]
+    p2 = HIGH[m2 & ~_bit(p1)]
+    two_pair = (2 << 20) | (p1 << 16) | (p2 << 12) | (HIGH[m1 & ~_bit(p1) & ~_bit(p2)] << 8)
+    pair = (1 << 20) | (p1 << 16) | (TOP3[m1 & ~_bit(p1)] << 4)
+
+    return np.select(
+        [has_flush, q > 0, (t > 0) & (full_pair > 0), top > 0, t > 0, p2 > 0, p1 > 0],
+        [flush, quads, full, straight, trips, two_pair, pair],
+        default=TOP5[m1],
+    )
+
+def evaluate_batch(cards):
+    """Scoruri pentru un tablou (N, 5..7) de cărți întregi -> tablou (N,) int64."""
+    cards = np.asarray(cards, dtype=np.int64)
+    if cards.ndim != 2 or not 5 <= cards.shape[1] <= 7:
+        raise ValueError(f"aștept un tablou (N, 5..7) de cărți, primit {cards.shape}")
+    if len(cards) <= CHUNK: return _evaluate_chunk(cards)
+    return np.concatenate([_evaluate_chunk(cards[i:i + CHUNK]) for i in range(0, len(cards), CHUNK)])
+
+
+if __name__ == "__main__":
+    # verificare de paritate cu evaluator.evaluate()
+    import sys
+    from .evaluator import evaluate
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = np.random.default_rng(12345)
+    for k in (5, 6, 7):
+        hands = np.argsort(rng.random((n, 52)), axis=1)[:, :k]
+        got = evaluate_batch(hands)
+        for i, h in enumerate(hands.tolist()):
+            assert got[i] == evaluate(h), (h, int(got[i]), evaluate(h))
+    print(f"OK: {3 * n} mâini identice cu evaluatorul cu tabele")
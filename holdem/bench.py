@@ -0,0 +1,221 @@
+import argparse, json, pathlib, platform, random, subprocess, sys, time
+
+from .cache import shared_cache
+from .deck import iter_deals, make_deck, riffle_shuffle
+from .evaluator import best_of_seven, best_of_seven_with_combo, evaluate, evaluate_5
+from .incremental import add_street, table_counters, table_scores
+from .render import build_table_html
+from .showdown import winner_details_with_combos
+from .texture import legend_possibles_on_river
+
+# ===== Benchmark-uri (fără Streamlit) =====
+# Fiecare caz procesează un lot fix de intrări generate din seed; lotul se repetă
+# până trec cel puțin `min_time` secunde, iar rezultatul e „mâini/secundă”.
+# Cazurile marcate per_players rulează pentru fiecare număr de jucători cerut.
+DEFAULT_FLOORS = pathlib.Path(__file__).resolve().parent.parent / "bench_floors.json"
+
+def _hands(rng, k, n): return [tuple(rng.sample(range(52), k)) for _ in range(n)]
+
+def _table_states(players, seed, n):
+    # stări de mână la showdown, ca în aplicație
+    states = []
+    for d in iter_deals(players, seed, n):
+        board5 = d.flop + (d.turn, d.river)
+        winners, desc, combos = winner_details_with_combos(d.hands, board5)
+        states.append({"dealer": d.dealer, "hands": d.hands, "flop": d.flop, "turn": d.turn,
+                       "river": d.river, "stage": "show", "show": True, "winners": winners,
+                       "winner_descriptions": desc, "winner_combos": combos})
+    return states
+
+def case_evaluate_5(seed, players):
+    hands = _hands(random.Random(seed), 5, 2000)
+    return len(hands), lambda: [evaluate_5(h) for h in hands]
+
+def case_evaluate(seed, players):
+    hands = _hands(random.Random(seed), 7, 20000)
+    return len(hands), lambda: [evaluate(h) for h in hands]
+
+def case_evaluate_batch(seed, players):
+    import numpy as np
+    from .batch import evaluate_batch
+    hands = np.asarray(_hands(random.Random(seed), 7, 100_000))
+    return len(hands), lambda: evaluate_batch(hands)
+
+def case_best_of_seven(seed, players):
+    hands = _hands(random.Random(seed), 7, 5000)
+    return len(hands), lambda: [best_of_seven(h) for h in hands]
+
+def case_best_of_seven_with_combo(seed, players):
+    hands = _hands(random.Random(seed), 7, 5000)
+    return len(hands), lambda: [best_of_seven_with_combo(h) for h in hands]
+
+def case_legend_possibles_on_river(seed, players):
+    boards = _hands(random.Random(seed), 5, 500)
+    cache = shared_cache("river_possibles", 8192)
+    def run():
+        cache.clear()  # se măsoară calculul, nu cache-ul
+        for b in boards: legend_possibles_on_river(b)
+    return len(boards), run
+
+def case_riffle_shuffle(seed, players):
+    rng = random.Random(seed)
+    def run():
+        for _ in range(1000): riffle_shuffle(make_deck(), rng)
+    return 1000, run
+
+def case_showdown(seed, players):
+    deals = [(d.hands, d.flop + (d.turn, d.river)) for d in iter_deals(players, seed, 1000)]
+    cache = shared_cache("showdown", 4096)
+    def run():
+        cache.clear()
+        for hands, board5 in deals: winner_details_with_combos(hands, board5)
+    return len(deals), run
+
+def case_streets(seed, players):
+    # flop -> turn -> river pe contoarele incrementale, ca progress_step
+    deals = list(iter_deals(players, seed, 1000))
+    def run():
+        for d in deals:
+            counters = table_counters(d.hands, d.flop); table_scores(counters)
+            add_street(counters, d.turn); table_scores(counters)
+            add_street(counters, d.river); table_scores(counters)
+    return len(deals), run
+
+def case_render(seed, players):
+    states = _table_states(players, seed, 300)
+    return len(states), lambda: [build_table_html(s, players, 1) for s in states]
+
+CASES = {
+    "evaluate_5": (case_evaluate_5, False),
+    "evaluate": (case_evaluate, False),
+    "evaluate_batch": (case_evaluate_batch, False),
+    "best_of_seven": (case_best_of_seven, False),
+    "best_of_seven_with_combo": (case_best_of_seven_with_combo, False),
+    "legend_possibles_on_river": (case_legend_possibles_on_river, False),
+    "riffle_shuffle": (case_riffle_shuffle, False),
+    "showdown": (case_showdown, True),
+    "streets": (case_streets, True),
+    "render": (case_render, True),
+}
+
+# ===== Pornire la rece (procese noi) =====
+# Fiecare scenariu rulează într-un interpretor nou și își raportează singur durata,
+# de la primul import până la rezultat; se păstrează mediana din `repeat` rulări.
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+STARTUP_SCENARIOS = {
+    # motorul fără equity: cărți, stare, randare, istoric
+    "import_engine": "import holdem.game, holdem.render, holdem.history",
+    # o mână completă până la showdown, randată
+    "first_hand": ("import holdem.game as g, holdem.render as r\n"
+                   "s = g.new_hand_state(10, 1, seed=1)\n"
+                   "for _ in range(3): g.progress_step(s)\n"
+                   "r.build_table_html(s, 10, 1)"),
+    # primul rerun al aplicației (Streamlit AppTest), cu equity-ul implicit
+    "app_first_run": ("from streamlit.testing.v1 import AppTest\n"
+                      "AppTest.from_file(%r, default_timeout=120).run()" % str(ROOT / "pkr-tx-h.py")),
+}
+
+def startup_times(names=None, repeat=5, log=None):
+    results = []
+    for name, code in STARTUP_SCENARIOS.items():
+        if names and name not in names: continue
+        prog = ("import time; _t0 = time.perf_counter()\n" + code +
+                "\nprint(time.perf_counter() - _t0)")
+        times = []
+        for _ in range(repeat):
+            out = subprocess.run([sys.executable, "-c", prog], capture_output=True, text=True, cwd=ROOT)
+            if out.returncode != 0:
+                if log: log(f"{name}: eșuat ({out.stderr.strip().splitlines()[-1:]})")
+                break
+            times.append(float(out.stdout.strip().splitlines()[-1]))
+        if not times: continue
+        times.sort()
+        r = {"name": name, "runs": len(times), "median_ms": round(times[len(times) // 2] * 1000, 1),
+             "min_ms": round(times[0] * 1000, 1)}
+        results.append(r)
+        if log: log(f"pornire {name}: {r['median_ms']:,.1f} ms (min {r['min_ms']:,.1f})")
+    return results
+
+def measure(fn, n, min_time):
+    fn()  # încălzire
+    reps = 0
+    t0 = time.perf_counter()
+    while True:
+        fn(); reps += 1
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time: break
+    return n * reps, elapsed
+
+def run_benchmarks(names=None, players=range(2, 11), seed=2024, min_time=0.3, log=None):
+    results = []
+    for name, (case, per_players) in CASES.items():
+        if names and name not in names: continue
+        for p in (players if per_players else [None]):
+            n, fn = case(seed, p or 2)
+            count, elapsed = measure(fn, n, min_time)
+            r = {"name": name, "players": p, "hands": count, "seconds": round(elapsed, 4),
+                 "hands_per_sec": round(count / elapsed, 1)}
+            results.append(r)
+            if log: log(f"{name}{'' if p is None else f'@{p}'}: {r['hands_per_sec']:,.0f} mâini/s")
+    return results
+
+def _git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                             cwd=pathlib.Path(__file__).resolve().parent, timeout=5)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def check_floors(results, floors):
+    """Lista rezultatelor sub prag; cheile pragurilor: "nume@jucători" sau "nume"."""
+    failed = []
+    for r in results:
+        key = r["name"] if r["players"] is None else f"{r['name']}@{r['players']}"
+        floor = floors.get(key, floors.get(r["name"]))
+        if floor is not None and r["hands_per_sec"] < floor:
+            failed.append((key, r["hands_per_sec"], floor))
+    return failed
+
+def _players(text):
+    if "-" in text:
+        a, b = text.split("-")
+        return list(range(int(a), int(b) + 1))
+    return [int(x) for x in text.split(",")]
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark-uri pentru evaluator, amestecare, showdown și randare.")
+    ap.add_argument("--only", nargs="*", choices=list(CASES), help="doar aceste cazuri")
+    ap.add_argument("--players", type=_players, default=list(range(2, 11)), help="ex. 2-10 sau 2,6,10")
+    ap.add_argument("--seed", type=int, default=2024)
+    ap.add_argument("--min-time", type=float, default=0.3, help="secunde per caz")
+    ap.add_argument("--out", type=pathlib.Path, help="fișier JSON (implicit: stdout)")
+    ap.add_argument("--startup", action="store_true", help="măsoară și pornirea la rece (procese noi)")
+    ap.add_argument("--startup-repeat", type=int, default=5)
+    ap.add_argument("--floors", type=pathlib.Path, default=None,
+                    help=f"JSON cu praguri minime mâini/s (implicit: {DEFAULT_FLOORS.name}, dacă există)")
+    args = ap.parse_args(argv)
+
+    log = lambda m: print(m, file=sys.stderr, flush=True)
+    results = run_benchmarks(args.only, args.players, args.seed, args.min_time, log=log)
+    report = {
+        "meta": {"commit": _git_commit(), "python": platform.python_version(),
+                 "platform": platform.platform(), "seed": args.seed, "min_time": args.min_time,
+                 "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z")},
+        "results": results,
+    }
+    if args.startup: report["startup"] = startup_times(repeat=args.startup_repeat, log=log)
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.out: args.out.write_text(text + "\n", encoding="utf-8")
+    else: print(text)
+
+    floors_path = args.floors or (DEFAULT_FLOORS if DEFAULT_FLOORS.exists() else None)
+    if floors_path:
+        failed = check_floors(results, json.loads(floors_path.read_text(encoding="utf-8")))
+        for key, got, floor in failed:
+            print(f"SUB PRAG: {key}: {got:,.0f} < {floor:,.0f} mâini/s", file=sys.stderr)
+        if failed: return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+import threading
+from collections import OrderedDict
+
+# ===== Cache LRU la nivel de proces (partajat între mâini și sesiuni) =====
+_MISSING = object()
+
+class LRUCache:
+    """Dicționar cu evacuare LRU la `maxsize` intrări și contoare hit/miss; thread-safe."""
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = self.misses = self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self): return len(self._data)
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key, compute):
+        # calculul rulează în afara lock-ului; două fire pot calcula aceeași cheie o dată
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def resize(self, maxsize):
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._data) > maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {"size": len(self._data), "maxsize": self.maxsize, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0}
+
+_CACHES = {}
+_CACHES_LOCK = threading.Lock()
+
+def shared_cache(name, maxsize=4096):
+    """Cache-ul cu numele dat, creat o singură dată per proces."""
+    with _CACHES_LOCK:
+        cache = _CACHES.get(name)
+        if cache is None:
+            cache = _CACHES[name] = LRUCache(maxsize)
+        return cache
+
+def configure_caches(limits):
+    """Fixează dimensiunea maximă a cache-urilor comune, ex. {"showdown": 20_000};
+       cache-urile încă necreate se creează direct cu limita dată."""
+    for name, maxsize in limits.items():
+        shared_cache(name, maxsize).resize(maxsize)
+
+def cache_stats():
+    with _CACHES_LOCK:
+        return {name: cache.stats() for name, cache in _CACHES.items()}
@@ -0,0 +1,42 @@
+# ===== Canonicalizare izomorfă pe culori =====
+# Două situații care diferă doar printr-o permutare a culorilor au aceleași
+# răspunsuri (scoruri, câștigători, categorii, equity). Culorile se renumerotează
+# după „semnătura” lor: ce ranguri are fiecare culoare în fiecare grup de cărți
+# (board, apoi mâinile în ordinea locurilor). Culorile cu semnături egale sunt
+# interschimbabile, deci ordinea dintre ele nu schimbă cheia.
+
+def suit_permutation(groups):
+    """perm[s] = culoarea canonică pentru culoarea s."""
+    sig = [[] for _ in range(4)]
+    for g in groups:
+        per_suit = [[] for _ in range(4)]
+        for c in g: per_suit[c & 3].append(c >> 2)
+        for s in range(4): sig[s].append(tuple(sorted(per_suit[s], reverse=True)))
+    order = sorted(range(4), key=lambda s: sig[s], reverse=True)
+    perm = [0] * 4
+    for canon, s in enumerate(order): perm[s] = canon
+    return perm
+
+def apply_permutation(cards, perm): return tuple((c & ~3) | perm[c & 3] for c in cards)
+
+def inverse_permutation(perm):
+    inv = [0] * 4
+    for s, canon in enumerate(perm): inv[canon] = s
+    return inv
+
+def canonical_key(hands, board):
+    """Cheie canonică pentru (mâini, board): board-ul sortat + fiecare mână sortată,
+       după renumerotarea culorilor. Ordinea mâinilor (locurile) se păstrează."""
+    board = tuple(board)
+    perm = suit_permutation([board] + [tuple(h) for h in hands])
+    return (tuple(sorted(apply_permutation(board, perm))),
+            tuple(tuple(sorted(apply_permutation(h, perm))) for h in hands))
+
+def canonical_board(board):
+    return canonical_key((), board)[0]
+
+
+if __name__ == "__main__":
+    # 22.100 flop-uri -> 1.755 clase izomorfe
+    from itertools import combinations
+    print(len({canonical_board(f) for f in combinations(range(52), 3)}), "flop-uri distincte")
@@ -0,0 +1,25 @@
+# ===== Cărți codificate ca întregi =====
+# carte = index_rang * 4 + index_culoare (0..51), aceeași ordine ca pachetul nou
+RANKS = ["2","3","4","5","6","7","8","9","10","J","Q","K","A"]
+SUITS = "♣♦♥♠"
+RED_SUITS = {"♦", "♥"}
+RANK_VAL = {r: i for i, r in enumerate(RANKS, start=2)}
+VAL_RANK = {v: r for r, v in RANK_VAL.items()}
+
+# tabele precalculate per carte (fără slicing/parsing la evaluare)
+CARD_STRS = [r + s for r in RANKS for s in SUITS]
+CARD_INDEX = {c: i for i, c in enumerate(CARD_STRS)}
+RANK_OF = [c >> 2 for c in range(52)]          # 0..12 (2..A)
+VALUE_OF = [(c >> 2) + 2 for c in range(52)]   # 2..14, ca RANK_VAL
+SUIT_OF = [c & 3 for c in range(52)]           # index în SUITS
+CARD_BIT = [1 << c for c in range(52)]
+RANK_STR = [RANKS[c >> 2] for c in range(52)]
+SUIT_STR = [SUITS[c & 3] for c in range(52)]
+IS_RED = [SUITS[c & 3] in RED_SUITS for c in range(52)]
+
+def cards_to_ints(cards): return [CARD_INDEX[c] for c in cards]
+
+def cards_mask(cards):
+    m = 0
+    for c in cards: m |= CARD_BIT[c]
+    return m
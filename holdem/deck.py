@@ -0,0 +1,80 @@
+import random
+from collections import namedtuple
+
+from .cards import cards_mask
+
+# ===== Pachet & amestecare (cărți întregi 0..51) =====
+SHUFFLE_MODES = ("riffle", "fisher-yates")
+
+def make_deck(): return list(range(52))
+
+def riffle_shuffle(deck, rng, times=5):
+    """Riffle cu indici: aceleași apeluri rng ca varianta cu liste tăiate la fiecare
+       pas, deci aceeași ordine finală pentru același seed, dar O(n) per trecere."""
+    randint = rng.randint
+    for _ in range(times):
+        cut = randint(18, 34)
+        left, right = deck[:cut], deck[cut:]
+        nl, nr = len(left), len(right)
+        inter = []
+        i = j = 0
+        while i < nl or j < nr:
+            tl = randint(1, 3); tr = randint(1, 3)
+            inter += left[i:i + tl]; i += tl
+            inter += right[j:j + tr]; j += tr
+        k = randint(5, 15)
+        deck[:] = inter[-k:] + inter[:-k]
+
+def shuffle_deck(deck, rng, mode="riffle"):
+    # "riffle" = amestecarea din joc (reproduce mâinile existente pentru un seed);
+    # "fisher-yates" = permutare uniformă, mai rapidă, pentru simulări
+    if mode == "riffle": riffle_shuffle(deck, rng)
+    elif mode == "fisher-yates": rng.shuffle(deck)
+    else: raise ValueError(f"mod de amestecare necunoscut: {mode!r} (aștept {SHUFFLE_MODES})")
+
+# ===== Împărțire =====
+def seat_order(dealer_pos, num_players):
+    return [(dealer_pos + 1 + i) % num_players for i in range(num_players)]
+
+def deal_hole_cards(deck, num_players, dealer_pos):
+    # câte o carte pe rând, începând din stânga dealerului; cărțile se scot o singură dată
+    hands = [None] * num_players
+    for i, p in enumerate(seat_order(dealer_pos, num_players)):
+        hands[p] = (deck[i], deck[i + num_players])
+    del deck[:2 * num_players]
+    return hands
+
+def deal_board(deck):
+    # burn, flop, burn, turn, burn, river
+    flop, turn, river = (deck[1], deck[2], deck[3]), deck[5], deck[7]
+    del deck[:8]
+    return flop, turn, river
+
+def remaining_cards(dead):
+    """Cărțile rămase în pachet, fără cele din `dead`."""
+    m = cards_mask(dead)
+    return [c for c in range(52) if not m >> c & 1]
+
+# ===== Generator de mâini (fără session_state) =====
+Deal = namedtuple("Deal", "dealer hands flop turn river")
+
+def deal_hand(rng, num_players, dealer_pos, mode="riffle"):
+    """O mână completă: pachet nou, amestecat cu `rng`; `dealer_pos` e 0-based."""
+    deck = make_deck()
+    shuffle_deck(deck, rng, mode)
+    hands = deal_hole_cards(deck, num_players, dealer_pos)
+    flop, turn, river = deal_board(deck)
+    return Deal(dealer_pos + 1, hands, flop, turn, river)
+
+def iter_deals(num_players, seed=None, count=None, dealer=1, rotate=True, mode="riffle"):
+    """Flux de mâini dintr-un singur random.Random(seed). Dealerul (1-based) pornește
+       de la `dealer` și, cu `rotate`, avansează ca în joc. Cu mode="riffle", prima
+       mână e identică cu cea din aplicație pentru același seed și același dealer.
+       `count=None` = flux infinit."""
+    rng = random.Random(seed)
+    cur = dealer
+    n = 0
+    while count is None or n < count:
+        yield deal_hand(rng, num_players, cur - 1, mode)
+        if rotate: cur = (cur % num_players) + 1
+        n += 1
@@ -0,0 +1,69 @@
+import math, random
+from collections import namedtuple
+from concurrent.futures import CancelledError
+
+import numpy as np
+
+from .batch import evaluate_batch
+from .deck import remaining_cards
+from .metrics import timed
+
+# ===== Equity Monte Carlo pentru TU =====
+Equity = namedtuple("Equity", "win tie equity ci_low ci_high samples")
+
+CHUNK = 1 << 15
+
+def _draw(gen, remaining, n, need):
+    # `need` cărți distincte per rând, în ordine aleatoare (argpartition alege
+    # mulțimea, argsort pe valorile alese le amestecă)
+    vals = gen.random((n, len(remaining)))
+    idx = np.argpartition(vals, need - 1, axis=1)[:, :need]
+    order = np.argsort(np.take_along_axis(vals, idx, axis=1), axis=1)
+    return remaining[np.take_along_axis(idx, order, axis=1)]
+
+def _chunk_shares(gen, hero, board, remaining, num_opponents, n):
+    nb = 5 - len(board)
+    drawn = _draw(gen, remaining, n, nb + 2 * num_opponents)
+    full_board = np.hstack([np.broadcast_to(np.asarray(board, dtype=np.int64), (n, len(board))), drawn[:, :nb]])
+    seats = [np.broadcast_to(np.asarray(hero, dtype=np.int64), (n, 2))]
+    seats += [drawn[:, nb + 2 * j: nb + 2 * j + 2] for j in range(num_opponents)]
+    cards = np.concatenate([np.hstack([h, full_board]) for h in seats])
+    scores = evaluate_batch(cards).reshape(num_opponents + 1, n)
+    hero_s, best_opp = scores[0], scores[1:].max(axis=0)
+    ties = (scores[1:] == hero_s).sum(axis=0)
+    win = hero_s > best_opp
+    tie = hero_s == best_opp
+    return win, tie, np.where(win, 1.0, np.where(tie, 1.0 / (ties + 1), 0.0))
+
+@timed()
+def hero_equity(hero, board, num_opponents, samples=100_000, seed=None, rng=None, z=1.96, cancel=None):
+    """Probabilitatea de câștig/egal a mâinii `hero` contra `num_opponents` mâini
+       necunoscute, pe board-ul vizibil (0, 3, 4 sau 5 cărți), prin `samples` simulări.
+
+       Generatorul NumPy e inițializat din random.Random(seed) (sau `rng`), deci
+       același seed dă același rezultat. `ci_low`/`ci_high`: interval de încredere
+       (aproximare normală, `z`=1.96 -> 95%) pentru equity. `cancel` (threading.Event),
+       dacă e setat în timpul calculului, oprește simularea cu CancelledError."""
+    if num_opponents < 1: return Equity(1.0, 0.0, 1.0, 1.0, 1.0, 0)
+    rng = rng or random.Random(seed)
+    gen = np.random.default_rng(rng.getrandbits(64))
+    board = tuple(board)
+    remaining = np.asarray(remaining_cards(tuple(hero) + board), dtype=np.int64)
+    if 5 - len(board) + 2 * num_opponents > len(remaining):
+        raise ValueError("prea mulți adversari pentru cărțile rămase")
+
+    wins = ties = 0; total = total_sq = 0.0
+    done = 0
+    while done < samples:
+        if cancel is not None and cancel.is_set(): raise CancelledError()
+        n = min(CHUNK, samples - done)
+        win, tie, share = _chunk_shares(gen, hero, board, remaining, num_opponents, n)
+        wins += int(win.sum()); ties += int(tie.sum())
+        total += float(share.sum()); total_sq += float((share * share).sum())
+        done += n
+
+    mean = total / samples
+    var = max(total_sq / samples - mean * mean, 0.0)
+    half = z * math.sqrt(var / samples)
+    return Equity(wins / samples, ties / samples, mean,
+                  max(mean - half, 0.0), min(mean + half, 1.0), samples)
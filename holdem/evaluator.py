@@ -0,0 +1,278 @@
+import marshal, pathlib, threading
+from itertools import combinations
+
+from .cards import VALUE_OF, SUIT_OF
+
+# ===== Evaluare (referință, 5 cărți întregi) =====
+def card_vals(cards): return sorted([VALUE_OF[c] for c in cards], reverse=True)
+
+def is_flush(cards):
+    suits = [SUIT_OF[c] for c in cards]
+    for s in range(4):
+        if suits.count(s) == 5: return True, s
+    return False, None
+
+def is_straight(vals):
+    u = sorted(set(vals), reverse=True)
+    if 14 in u: u.append(1)  # wheel
+    for i in range(len(u) - 4):
+        seq = u[i:i+5]
+        if seq[0] - seq[4] == 4: return True, seq[0]
+    return False, 0
+
+# 8=SF,7=Four,6=Full,5=Flush,4=Straight,3=Trips,2=TwoPair,1=Pair,0=High
+def evaluate_5(cards):
+    vals = card_vals(cards)
+    freq = {}
+    for v in vals: freq[v] = freq.get(v, 0) + 1
+    groups = sorted(freq.items(), key=lambda x: (x[1], x[0]), reverse=True)
+    counts = [g[1] for g in groups]
+
+    flush, flush_suit = is_flush(cards)
+    straight, top_st = is_straight(vals)
+
+    if flush:
+        flush_vals = card_vals([c for c in cards if SUIT_OF[c] == flush_suit])
+        sf, sf_top = is_straight(flush_vals)
+        if sf: return (8, sf_top)
+
+    if 4 in counts:
+        four = groups[0][0]
+        kicker = max([v for v in vals if v != four]) if any(v != four for v in vals) else 0
+        return (7, four, kicker)
+
+    if 3 in counts and 2 in counts:
+        trips = [v for v, c in groups if c == 3][0]
+        pair  = [v for v, c in groups if c == 2][0]
+        return (6, trips, pair)
+
+    if flush: return (5, sorted(vals, reverse=True))
+    if straight: return (4, top_st)
+
+    if 3 in counts:
+        trips = [v for v, c in groups if c == 3][0]
+        kickers = [v for v in vals if v != trips][:2]
+        return (3, trips, kickers)
+
+    pairs = [v for v, c in groups if c == 2]
+    if len(pairs) >= 2:
+        top2 = pairs[:2]
+        kicker = [v for v in vals if v not in top2][0]
+        return (2, top2, kicker)
+
+    if 2 in counts:
+        pair = [v for v, c in groups if c == 2][0]
+        kickers = [v for v in vals if v != pair][:3]
+        return (1, pair, kickers)
+
+    return (0, vals)
+
+def best_of_seven_bruteforce(cards7):
+    best = None
+    for combo in combinations(cards7, 5):
+        score = evaluate_5(combo)
+        if (best is None) or (score > best): best = score
+    return best
+
+# ===== Evaluator cu tabele (5–7 cărți) =====
+# Scorul e un singur int comparabil: categoria în biții 20+, apoi până la 5 valori
+# de rang (2..14) pe câte 4 biți, în ordinea din tuplul lui evaluate_5.
+# Rangurile intră într-o cheie în baza 5 (max 4 cărți de același rang), culorile
+# în câte un nibble; o culoare cu >= 5 cărți se citește direct din tabela de flush.
+RANK_KEY = [5 ** (c >> 2) for c in range(52)]
+SUIT_KEY = [1 << (4 * (c & 3)) for c in range(52)]
+FLUSH_NIBBLE = {0x8: 0, 0x80: 1, 0x800: 2, 0x8000: 3}
+
+def pack_score(cat, *vals):
+    score = cat
+    for i in range(5):
+        score = (score << 4) | (vals[i] if i < len(vals) else 0)
+    return score
+
+def _score_vals(score): return [(score >> sh) & 0xF for sh in (16, 12, 8, 4, 0)]
+
+def decode_score(score):
+    """Transformă scorul întreg înapoi în tuplul (categorie, ...) al lui evaluate_5."""
+    cat = score >> 20
+    v = _score_vals(score)
+    if cat in (8, 4): return (cat, v[0])
+    if cat in (7, 6): return (cat, v[0], v[1])
+    if cat == 3: return (3, v[0], v[1:3])
+    if cat == 2: return (2, v[0:2], v[2])
+    if cat == 1: return (1, v[0], v[1:4])
+    return (cat, v)
+
+def _top_vals(mask, k):
+    out = []
+    for r in range(12, -1, -1):
+        if mask >> r & 1:
+            out.append(r + 2)
+            if len(out) == k: break
+    return out
+
+# ferestrele de 5 ranguri consecutive, de la A-high la wheel A-2-3-4-5
+_STRAIGHT_WINDOWS = [(0x1F << (top - 4), top + 2) for top in range(12, 3, -1)] + [(0x100F, 5)]
+
+def _straight_top(mask):
+    for w, top in _STRAIGHT_WINDOWS:
+        if mask & w == w: return top
+    return 0
+
+STRAIGHT_TOP = [_straight_top(m) for m in range(1 << 13)]
+
+def _flush_score(mask):
+    top = STRAIGHT_TOP[mask]
+    if top: return pack_score(8, top)
+    return pack_score(5, *_top_vals(mask, 5))
+
+def _rank_score(counts):
+    # counts[r] = câte cărți de rangul r (0 = „2”); se parcurge de la As în jos
+    mask = 0; quads = []; trips = []; pairs = []; present = []
+    for r in range(12, -1, -1):
+        k = counts[r]
+        if k:
+            v = r + 2
+            mask |= 1 << r; present.append(v)
+            if k >= 2: pairs.append(v)
+            if k >= 3: trips.append(v)
+            if k == 4: quads.append(v)
+    if quads:
+        q = quads[0]
+        return pack_score(7, q, present[1] if present[0] == q else present[0])
+    if trips:
+        t = trips[0]
+        for v in pairs:
+            if v != t: return pack_score(6, t, v)
+    top = STRAIGHT_TOP[mask]
+    if top: return pack_score(4, top)
+    if trips:
+        t = trips[0]
+        return pack_score(3, t, *[v for v in present if v != t][:2])
+    if len(pairs) >= 2:
+        p1, p2 = pairs[0], pairs[1]
+        return pack_score(2, p1, p2, next(v for v in present if v != p1 and v != p2))
+    if pairs:
+        p = pairs[0]
+        return pack_score(1, p, *[v for v in present if v != p][:3])
+    return pack_score(0, *present[:5])
+
+def _rank_multisets(n, r=0, key=0, counts=None):
+    # toate multiseturile de n ranguri (max 4 din fiecare), cu cheia lor în baza 5
+    if counts is None: counts = [0] * 13
+    if r == 13:
+        if n == 0: yield key, counts
+        return
+    for k in range(min(4, n) + 1):
+        counts[r] = k
+        yield from _rank_multisets(n - k, r + 1, key + k * 5 ** r, counts)
+    counts[r] = 0
+
+def _build_tables():
+    flush = [0] * (1 << 13)
+    for m in range(1 << 13):
+        if bin(m).count("1") >= 5: flush[m] = _flush_score(m)
+    ranks = {}
+    for n in (5, 6, 7):
+        for key, counts in _rank_multisets(n):
+            ranks[key] = _rank_score(counts)
+    return flush, ranks
+
+TABLES_VERSION = 1
+TABLES_CACHE = pathlib.Path(__file__).with_name("_eval_tables.bin")
+
+def _load_tables(path=TABLES_CACHE):
+    # construirea durează ~0.5s; rezultatul se păstrează pe disc pentru pornirile următoare
+    try:
+        version, flush, ranks = marshal.loads(path.read_bytes())
+        if version == TABLES_VERSION: return flush, ranks
+    except (OSError, ValueError, EOFError, TypeError):
+        pass
+    flush, ranks = _build_tables()
+    try:
+        path.write_bytes(marshal.dumps((TABLES_VERSION, flush, ranks)))
+    except OSError:
+        pass
+    return flush, ranks
+
+# Tabelele se încarcă leneș, la prima evaluare, în aceleași obiecte: modulele care
+# le-au importat deja (incremental, texture, batch) văd conținutul fără re-import.
+# Importul modulului nu mai costă citirea fișierului (~20 ms) sau construirea (~0.5 s).
+FLUSH_TABLE = []
+RANK_TABLE = {}
+_TABLES_LOCK = threading.Lock()
+
+def ensure_tables():
+    if FLUSH_TABLE: return
+    with _TABLES_LOCK:
+        if FLUSH_TABLE: return
+        flush, ranks = _load_tables()
+        RANK_TABLE.update(ranks)
+        FLUSH_TABLE.extend(flush)  # ultimul: FLUSH_TABLE ne-gol = tabele complete
+
+def evaluate(cards):
+    """Scor întreg pentru 5, 6 sau 7 cărți întregi (0..51); mai mare = mai bun."""
+    if not FLUSH_TABLE: ensure_tables()
+    rk = sk = 0
+    for c in cards:
+        rk += RANK_KEY[c]; sk += SUIT_KEY[c]
+    f = (sk + 0x3333) & 0x8888
+    if f:
+        s = FLUSH_NIBBLE[f]; m = 0
+        for c in cards:
+            if c & 3 == s: m |= 1 << (c >> 2)
+        return FLUSH_TABLE[m]
+    return RANK_TABLE[rk]
+
+def best_combo(ints, score):
+    """Indicii celor 5 cărți care formează scorul (primele în ordinea din mână, ca la combinations)."""
+    cat = score >> 20
+    v = _score_vals(score)
+    suit = None
+    if cat in (8, 5):
+        sk = 0
+        for c in ints: sk += SUIT_KEY[c]
+        suit = FLUSH_NIBBLE[(sk + 0x3333) & 0x8888]
+    if cat in (8, 4):
+        top = v[0]
+        need = {(14 if top - i == 1 else top - i): 1 for i in range(5)}
+    elif cat == 7: need = {v[0]: 4, v[1]: 1}
+    elif cat == 6: need = {v[0]: 3, v[1]: 2}
+    elif cat == 3: need = {v[0]: 3, v[1]: 1, v[2]: 1}
+    elif cat == 2: need = {v[0]: 2, v[1]: 2, v[2]: 1}
+    elif cat == 1: need = {v[0]: 2, v[1]: 1, v[2]: 1, v[3]: 1}
+    else: need = {x: 1 for x in v}
+    picked = []
+    for i, c in enumerate(ints):
+        val = (c >> 2) + 2
+        if need.get(val) and (suit is None or c & 3 == suit):
+            need[val] -= 1; picked.append(i)
+    return picked
+
+def best_of_seven(cards7):
+    return decode_score(evaluate(cards7))
+
+def best_of_seven_with_combo(cards7):
+    score = evaluate(cards7)
+    return decode_score(score), [cards7[i] for i in best_combo(cards7, score)]
+
+
+if __name__ == "__main__":
+    # verificare de paritate cu evaluatorul de referință (21 de combinații × evaluate_5);
+    # `--build-tables` doar (re)construiește fișierul de tabele, ex. la instalare
+    import random, sys
+    if sys.argv[1:] == ["--build-tables"]:
+        TABLES_CACHE.unlink(missing_ok=True)
+        ensure_tables()
+        print(f"{TABLES_CACHE}: {TABLES_CACHE.stat().st_size:,} B")
+        sys.exit(0)
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(12345)
+    for i in range(n):
+        hand = rng.sample(range(52), 7)
+        ref = best_of_seven_bruteforce(hand)
+        got, combo = best_of_seven_with_combo(hand)
+        assert got == ref, (hand, got, ref)
+        assert evaluate_5(combo) == ref, (hand, combo, ref)
+        k = rng.randint(5, 6)
+        assert decode_score(evaluate(hand[:k])) == best_of_seven_bruteforce(hand[:k]), hand[:k]
+    print(f"OK: {n} mâini identice cu evaluatorul de referință")
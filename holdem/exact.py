@@ -0,0 +1,131 @@
+import multiprocessing, os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+import numpy as np
+
+from .batch import evaluate_batch
+from .cache import shared_cache
+from .canonical import canonical_key
+from .deck import remaining_cards
+
+# ===== Enumerare exactă (equity heads-up + histograme de categorii) =====
+# Spațiul (runout × mâna adversarului) se împarte pe bucăți de runout-uri;
+# fiecare worker întoarce doar contoare, care se adună la final.
+ExactResult = namedtuple("ExactResult", "win tie lose equity total hero_categories opponent_categories")
+
+NUM_CATEGORIES = 9  # 0=High .. 8=SF, ca score >> 20
+
+_POOL = None
+_POOL_WORKERS = 0
+
+def get_pool(workers=None):
+    """Pool de procese persistent (la nivel de proces), refolosit între rerun-uri."""
+    global _POOL, _POOL_WORKERS
+    workers = workers or os.cpu_count() or 1
+    if _POOL is None or _POOL_WORKERS != workers:
+        if _POOL is not None: _POOL.shutdown(wait=False, cancel_futures=True)
+        _POOL = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        _POOL_WORKERS = workers
+    return _POOL
+
+def shutdown_pool():
+    global _POOL
+    if _POOL is not None:
+        _POOL.shutdown(wait=True, cancel_futures=True)
+        _POOL = None
+
+def _pair_index(n):
+    i, j = np.triu_indices(n, k=1)
+    return i, j
+
+def _equity_chunk(hero, board, runouts):
+    # contoare pentru o bucată de runout-uri: [win, tie, lose], categorii TU, categorii adversar
+    hero = tuple(hero); board = tuple(board)
+    win = tie = lose = 0
+    hero_cats = np.zeros(NUM_CATEGORIES, dtype=np.int64)
+    opp_cats = np.zeros(NUM_CATEGORIES, dtype=np.int64)
+    for run in runouts:
+        full = board + tuple(run)
+        rem = np.asarray(remaining_cards(hero + full), dtype=np.int64)
+        i, j = _pair_index(len(rem))
+        n = len(i)
+        boards = np.broadcast_to(np.asarray(full, dtype=np.int64), (n, 5))
+        opp = evaluate_batch(np.hstack([rem[i, None], rem[j, None], boards]))
+        h = int(evaluate_batch(np.asarray([hero + full], dtype=np.int64))[0])
+        w = int((h > opp).sum()); t = int((h == opp).sum())
+        win += w; tie += t; lose += n - w - t
+        hero_cats[h >> 20] += n
+        opp_cats += np.bincount(opp >> 20, minlength=NUM_CATEGORIES)
+    return win, tie, lose, hero_cats, opp_cats
+
+def _histogram_chunk(boards):
+    out = []
+    for board in boards:
+        rem = np.asarray(remaining_cards(board), dtype=np.int64)
+        i, j = _pair_index(len(rem))
+        b = np.broadcast_to(np.asarray(board, dtype=np.int64), (len(i), 5))
+        scores = evaluate_batch(np.hstack([rem[i, None], rem[j, None], b]))
+        out.append(np.bincount(scores >> 20, minlength=NUM_CATEGORIES))
+    return out
+
+def _split(items, parts):
+    size = max(1, -(-len(items) // parts))
+    return [items[k:k + size] for k in range(0, len(items), size)]
+
+def exact_equity(hero, board, workers=None, pool=None):
+    """Equity exactă a mâinii `hero` contra unei mâini aleatoare, enumerând toate
+       runout-urile board-ului (3, 4 sau 5 cărți vizibile) și toate mâinile adversarului.
+
+       Cu `workers` > 1 (sau un `pool` dat) bucățile rulează în paralel; cu
+       workers=1 totul rulează în procesul curent. Histogramele de categorii sunt
+       numărate pe fiecare pereche (runout, mână adversar). Rezultatul nu depinde de
+       culori, deci se păstrează în cache după cheia canonică."""
+    hero = tuple(hero); board = tuple(board)
+    if not 3 <= len(board) <= 5: raise ValueError("board-ul trebuie să aibă 3, 4 sau 5 cărți")
+    key = canonical_key([hero], board)
+    return shared_cache("exact_equity", 1024).get_or_compute(
+        key, lambda: _exact_equity(key[1][0], key[0], workers, pool))
+
+def _exact_equity(hero, board, workers, pool):
+    runouts = list(combinations(remaining_cards(hero + board), 5 - len(board)))
+    workers = workers or os.cpu_count() or 1
+    if pool is None and workers == 1:
+        parts = [_equity_chunk(hero, board, runouts)]
+    else:
+        pool = pool or get_pool(workers)
+        futures = [pool.submit(_equity_chunk, hero, board, chunk) for chunk in _split(runouts, workers * 4)]
+        parts = [f.result() for f in futures]
+
+    win = sum(p[0] for p in parts); tie = sum(p[1] for p in parts); lose = sum(p[2] for p in parts)
+    total = win + tie + lose
+    hero_cats = sum(p[3] for p in parts); opp_cats = sum(p[4] for p in parts)
+    return ExactResult(win, tie, lose, (win + tie / 2) / total, total, hero_cats.tolist(), opp_cats.tolist())
+
+def category_histograms(boards, workers=None, pool=None):
+    """Pentru fiecare board de 5 cărți: câte din cele 1081 de perechi posibile ajung
+       în fiecare categorie (listă de NUM_CATEGORIES contoare)."""
+    boards = [tuple(b) for b in boards]
+    workers = workers or os.cpu_count() or 1
+    if pool is None and workers == 1:
+        return [h.tolist() for h in _histogram_chunk(boards)]
+    pool = pool or get_pool(workers)
+    futures = [pool.submit(_histogram_chunk, chunk) for chunk in _split(boards, workers * 4)]
+    return [h.tolist() for f in futures for h in f.result()]
+
+
+if __name__ == "__main__":
+    # comparație serial vs. pool pe un flop fix (rezultatele trebuie să fie identice)
+    import sys, time
+    from .cards import CARD_INDEX
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1)
+    hero = (CARD_INDEX["A♠"], CARD_INDEX["K♠"])
+    board = (CARD_INDEX["Q♠"], CARD_INDEX["7♦"], CARD_INDEX["2♠"])
+    t = time.perf_counter(); serial = exact_equity(hero, board, workers=1); ts = time.perf_counter() - t
+    list(get_pool(workers).map(abs, range(workers * 4)))  # pornirea worker-ilor nu intră în măsurătoare
+    shared_cache("exact_equity").clear()
+    t = time.perf_counter(); par = exact_equity(hero, board, workers=workers); tp = time.perf_counter() - t
+    assert serial == par, (serial, par)
+    print(f"equity {serial.equity:.4f} pe {serial.total:,} cazuri; serial {ts:.2f}s, {workers} procese {tp:.2f}s")
+    shutdown_pool()
@@ -0,0 +1,109 @@
+import random, struct
+
+from .deck import deal_hand
+from .incremental import add_street, hand_label, table_counters, table_scores
+from .metrics import timed
+from .showdown import showdown_from_scores
+from .texture import legend_possibles_on_river
+
+# ===== Starea unei mâini (fără Streamlit) =====
+# Starea e un dict simplu, același pe care UI-ul îl ține în st.session_state.state;
+# funcțiile de aici pot rula la fel în workeri, benchmark-uri sau joburi batch.
+STAGES = ("flop", "turn", "river", "show")
+
+def clamp_dealer(dealer, num_players):
+    return dealer if 1 <= dealer <= num_players else 1
+
+def next_dealer(dealer, num_players, rotate=True):
+    """Dealerul (1-based) pentru mâna următoare: 1 → N → 1 dacă `rotate`."""
+    return (dealer % num_players) + 1 if rotate else dealer
+
+@timed()
+def new_hand_state(num_players, dealer, seed=None, rng=None):
+    """Împarte o mână nouă cu dealerul `dealer` (1-based) și întoarce starea ei.
+       Fără `rng`, pachetul se amestecă cu random.Random(seed), ca în aplicație."""
+    rng = rng or random.Random(seed)
+    _, hands, flop, turn, river = deal_hand(rng, num_players, dealer - 1)
+    return hand_state(dealer, hands, flop, turn, river)
+
+def hand_state(dealer, hands, flop, turn, river):
+    """Starea de pe flop pentru cărțile date (dealer 1-based)."""
+    counters = table_counters(hands, flop)
+    return {
+        "dealer": dealer,         # 1-based — dealerul MÂINII CURENTE (folosit în UI)
+        "hands": hands,
+        "flop": flop,
+        "turn": turn,
+        "river": river,
+        "stage": "flop",
+        "show": False,
+        "winners": [],
+        "winner_descriptions": [],
+        "winner_combos": [],
+        "possible_river": None,
+        "counters": counters,     # HandCounters per loc, actualizate la fiecare stradă
+        "scores": table_scores(counters),  # scorul fiecărui loc pe board-ul vizibil
+    }
+
+def full_board(s): return s["flop"] + (s["turn"], s["river"])
+
+def visible_board(s):
+    if s["stage"] == "flop": return s["flop"]
+    if s["stage"] == "turn": return s["flop"] + (s["turn"],)
+    return full_board(s)
+
+def compute_now(name, compute): return compute()
+
+def progress_step(s, collect=compute_now):
+    """Avansează starea cu o stradă: flop → turn → river → show. `collect(nume, calcul)`
+       poate întoarce un rezultat deja calculat în fundal (holdem.speculative)."""
+    if s["stage"] == "flop":
+        s["stage"] = "turn"
+        add_street(s["counters"], s["turn"])
+        s["scores"] = table_scores(s["counters"])
+    elif s["stage"] == "turn":
+        s["stage"] = "river"
+        add_street(s["counters"], s["river"])
+        s["scores"] = table_scores(s["counters"])
+        # calculează "posibile combinații" pe board-ul complet (abia acum avem riverul în state)
+        s["possible_river"] = collect("river", lambda: legend_possibles_on_river(full_board(s)))
+    elif s["stage"] == "river":
+        s["stage"] = "show"
+        s["show"] = True
+        # scorurile de la river sunt deja în stare: showdown-ul nu mai reevaluează nimic
+        board5 = full_board(s)
+        winners, descriptions, winner_combos = collect(
+            "showdown", lambda: showdown_from_scores([h + board5 for h in s["hands"]], s["scores"]))
+        s["winners"] = winners
+        s["winner_descriptions"] = descriptions
+        s["winner_combos"] = winner_combos
+    return s
+
+def seat_label(s, seat):
+    """Eticheta live a locului `seat` (0-based) pe strada curentă: mâna + proiecte."""
+    hc = s["counters"][seat]
+    return hand_label(s["scores"][seat], hc.draws(s["scores"][seat]))
+
+# ===== Stare compactă (per sesiune) =====
+# O mână încape în 3 + 2N + 5 octeți: jucători, dealer, stradă, cărțile locurilor, board-ul.
+# Restul stării (contoare, scoruri, câștigători, posibile) e determinist și se
+# reface la despachetare; părțile scumpe vin din cache-urile comune ale procesului.
+def pack_state(s):
+    n = len(s["hands"])
+    cards = [c for h in s["hands"] for c in h] + list(full_board(s))
+    return struct.pack(f"3B{2 * n + 5}B", n, s["dealer"], STAGES.index(s["stage"]), *cards)
+
+@timed()
+def unpack_state(data, collect=compute_now):
+    n, dealer, stage = data[0], data[1], data[2]
+    cards = data[3:]
+    hands = [(cards[2 * i], cards[2 * i + 1]) for i in range(n)]
+    b = cards[2 * n:]
+    s = hand_state(dealer, hands, (b[0], b[1], b[2]), b[3], b[4])
+    for _ in range(stage): progress_step(s, collect)
+    return s
+
+def hand_key(s):
+    """Identitatea mâinii (dealer + cărți), fără strada curentă; `s` = starea sau pack_state(starea)."""
+    data = s if isinstance(s, bytes) else pack_state(s)
+    return data[:2] + data[3:]
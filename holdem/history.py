@@ -0,0 +1,171 @@
+import argparse, csv, json, mmap, os, pathlib, struct, sys, threading, time
+from collections import namedtuple
+
+from .cards import CARD_STRS
+from .game import hand_state
+
+# ===== Istoricul mâinilor: jurnal binar cu înregistrări de mărime fixă =====
+# Antet (8 B): MAGIC + versiune + mărimea unei înregistrări. Înregistrare (40 B):
+#   uint32 timp unix, uint8 flags (bit 0 = are seed), uint8 jucători, uint8 dealer (1-based),
+#   int64 seed, 20 × uint8 cărțile locurilor (0xFF = loc liber), 5 × uint8 board.
+# Mâna i stă la HEADER.size + i * RECORD.size, deci citirea e acces direct prin mmap;
+# scrierea e doar adăugare la sfârșitul fișierului.
+MAGIC = b"PKRH"
+VERSION = 1
+HEADER = struct.Struct("<4sHH")
+RECORD = struct.Struct("<IBBBq25B")
+MAX_SEATS = 10
+EMPTY = 0xFF
+HAS_SEED = 1
+SEED_MIN, SEED_MAX = -(1 << 63), (1 << 63) - 1  # câmpul int64; în afara lui mâna se scrie fără seed
+
+Record = namedtuple("Record", "index time players dealer seed hands flop turn river")
+
+def pack_record(players, dealer, hands, board, seed=None, when=None):
+    cards = [c for h in hands for c in h] + [EMPTY] * (2 * (MAX_SEATS - players)) + list(board)
+    if seed is not None and not SEED_MIN <= seed <= SEED_MAX: seed = None  # cărțile rămân în jurnal
+    return RECORD.pack(int(time.time() if when is None else when), HAS_SEED if seed is not None else 0,
+                       players, dealer, 0 if seed is None else seed, *cards)
+
+def unpack_record(index, values):
+    when, flags, n, dealer, seed = values[:5]
+    cards = values[5:]
+    hands = [(cards[2 * i], cards[2 * i + 1]) for i in range(n)]
+    b = cards[2 * MAX_SEATS:]
+    return Record(index, when, n, dealer, seed if flags & HAS_SEED else None,
+                  hands, (b[0], b[1], b[2]), b[3], b[4])
+
+class HandLog:
+    """Jurnalul de mâini de la `path`; se creează la prima scriere. Thread-safe."""
+
+    def __init__(self, path):
+        self.path = pathlib.Path(path)
+        self._lock = threading.Lock()
+        self._map = None
+        self._mapped = 0  # octeți acoperiți de mmap-ul curent
+
+    def _check_header(self, head):
+        magic, version, size = HEADER.unpack(head)
+        if magic != MAGIC or version != VERSION or size != RECORD.size:
+            raise ValueError(f"{self.path}: nu e un jurnal de mâini v{VERSION}")
+
+    def append(self, state, seed=None):
+        """Adaugă mâna din starea `state` (holdem.game); întoarce indicele ei."""
+        board = state["flop"] + (state["turn"], state["river"])
+        rec = pack_record(len(state["hands"]), state["dealer"], state["hands"], board, seed)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "ab") as f:
+                size = f.seek(0, os.SEEK_END)
+                # antet sau ultimă înregistrare scrise pe jumătate (ex. proces oprit): se
+                # taie până la ultima înregistrare completă, altfel toate cele noi ar fi decalate
+                if size < HEADER.size:
+                    f.truncate(0)
+                    f.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+                elif (size - HEADER.size) % RECORD.size:
+                    f.truncate(size - (size - HEADER.size) % RECORD.size)
+                index = (f.seek(0, os.SEEK_END) - HEADER.size) // RECORD.size
+                f.write(rec)
+        return index
+
+    def _view(self):
+        # remapează doar când fișierul a crescut de la ultima citire; maparea veche nu se
+        # închide explicit: un iter_values în curs o mai folosește (memoryview), iar ea se
+        # eliberează singură când nu mai are cititori
+        with self._lock:
+            try:
+                size = os.path.getsize(self.path)
+            except OSError:
+                return None, 0
+            if size < HEADER.size: return None, 0  # gol (sau antet incomplet, refăcut la scriere)
+            if size > self._mapped:
+                with open(self.path, "rb") as f:
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self._check_header(self._map[:HEADER.size])
+                self._mapped = size
+            return self._map, (self._mapped - HEADER.size) // RECORD.size
+
+    def __len__(self): return self._view()[1]
+
+    def __getitem__(self, index):
+        m, n = self._view()
+        if index < 0: index += n
+        if not 0 <= index < n: raise IndexError(f"mâna {index} nu există (jurnal cu {n} mâini)")
+        return unpack_record(index, RECORD.unpack_from(m, HEADER.size + index * RECORD.size))
+
+    def iter_values(self, start=0, stop=None, batch=65536):
+        """Flux de (indice, valori brute) pentru [start, stop), citite pe loturi din mmap."""
+        m, n = self._view()
+        stop = n if stop is None else min(stop, n)
+        for lo in range(start, stop, batch):
+            hi = min(lo + batch, stop)
+            view = memoryview(m)[HEADER.size + lo * RECORD.size: HEADER.size + hi * RECORD.size]
+            yield from enumerate(RECORD.iter_unpack(view), lo)
+            view.release()
+
+    def iter_records(self, start=0, stop=None):
+        for i, values in self.iter_values(start, stop): yield unpack_record(i, values)
+
+    def close(self):
+        # ca la remapare: doar renunță la mapare, cititorii în curs o păstrează până termină
+        with self._lock:
+            self._map = None; self._mapped = 0
+
+def replay_state(record):
+    """Starea de pe flop (holdem.game) pentru o mână din jurnal."""
+    return hand_state(record.dealer, record.hands, record.flop, record.turn, record.river)
+
+# ===== Export (flux, fără a încărca jurnalul în memorie) =====
+EXPORT_COLUMNS = ["hand", "time", "players", "dealer", "seed", "board", "hands"]
+
+def export_rows(log, start=0, stop=None):
+    """Rânduri (liste, în ordinea EXPORT_COLUMNS) direct din valorile brute ale înregistrărilor."""
+    cs = CARD_STRS
+    for i, v in log.iter_values(start, stop):
+        n = v[2]
+        yield [i, v[0], n, v[3], v[4] if v[1] & HAS_SEED else None,
+               f"{cs[v[25]]} {cs[v[26]]} {cs[v[27]]} {cs[v[28]]} {cs[v[29]]}",
+               "|".join(f"{cs[v[5 + 2 * k]]} {cs[v[6 + 2 * k]]}" for k in range(n))]
+
+def export(log, out, fmt="csv", start=0, stop=None):
+    count = 0
+    if fmt == "csv":
+        w = csv.writer(out)
+        w.writerow(EXPORT_COLUMNS)
+        for row in export_rows(log, start, stop): w.writerow(row); count += 1
+    else:  # "json" = JSON Lines, un obiect pe linie
+        dumps, write = json.JSONEncoder(ensure_ascii=False).encode, out.write
+        for row in export_rows(log, start, stop):
+            write(dumps(dict(zip(EXPORT_COLUMNS, row)))); write("\n"); count += 1
+    return count
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Jurnalul de mâini: informații și export CSV / JSON Lines.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("info", help="numărul de mâini și ultima mână")
+    p.add_argument("log", type=pathlib.Path)
+    p = sub.add_parser("export", help="export în flux")
+    p.add_argument("log", type=pathlib.Path)
+    p.add_argument("--format", choices=["csv", "json"], default="csv")
+    p.add_argument("--out", type=pathlib.Path, help="fișier (implicit: stdout)")
+    p.add_argument("--start", type=int, default=0)
+    p.add_argument("--stop", type=int, default=None)
+    args = ap.parse_args(argv)
+
+    log = HandLog(args.log)
+    if args.cmd == "info":
+        n = len(log)
+        print(f"{args.log}: {n:,} mâini, {RECORD.size} B/mână")
+        if n: print(log[-1])
+        return
+    t0 = time.perf_counter()
+    if args.out:
+        with open(args.out, "w", newline="", encoding="utf-8") as f:
+            count = export(log, f, args.format, args.start, args.stop)
+    else:
+        count = export(log, sys.stdout, args.format, args.start, args.stop)
+    dt = time.perf_counter() - t0
+    print(f"{count:,} mâini exportate în {dt:.2f}s ({count / dt if dt else 0:,.0f} mâini/s)", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+from collections import namedtuple
+
+from .evaluator import FLUSH_NIBBLE, FLUSH_TABLE, RANK_KEY, RANK_TABLE, STRAIGHT_TOP, SUIT_KEY, decode_score, ensure_tables
+from .showdown import describe_score
+
+# ===== Evaluare incrementală, stradă cu stradă =====
+# Fiecare loc ține contoarele mâinii sale (cheia de ranguri, cheia de culori și
+# masca de ranguri pe fiecare culoare); o carte nouă pe board e o actualizare O(1),
+# iar scorul pentru 5, 6 sau 7 cărți e o singură căutare în FLUSH_TABLE / RANK_TABLE,
+# identic cu evaluator.evaluate pe aceleași cărți.
+Draws = namedtuple("Draws", "flush straight outs")  # outs pe proiect + total (cărți distincte)
+NO_DRAWS = Draws(0, 0, 0)
+
+class HandCounters:
+    __slots__ = ("rank_key", "suit_key", "suit_masks", "count")
+
+    def __init__(self, cards=()):
+        if not FLUSH_TABLE: ensure_tables()
+        self.rank_key = self.suit_key = self.count = 0
+        self.suit_masks = [0, 0, 0, 0]
+        for c in cards: self.add(c)
+
+    def add(self, card):
+        self.rank_key += RANK_KEY[card]
+        self.suit_key += SUIT_KEY[card]
+        self.suit_masks[card & 3] |= 1 << (card >> 2)
+        self.count += 1
+
+    def score(self):
+        """Scorul întreg al celor mai bune 5 cărți (cere 5..7 cărți)."""
+        f = (self.suit_key + 0x3333) & 0x8888
+        if f: return FLUSH_TABLE[self.suit_masks[FLUSH_NIBBLE[f]]]
+        return RANK_TABLE[self.rank_key]
+
+    def score_with(self, card):
+        """Scorul dacă s-ar adăuga `card`, fără a modifica contoarele (pentru outs)."""
+        sk = self.suit_key + SUIT_KEY[card]
+        f = (sk + 0x3333) & 0x8888
+        if f:
+            s = FLUSH_NIBBLE[f]
+            m = self.suit_masks[s]
+            if card & 3 == s: m |= 1 << (card >> 2)
+            return FLUSH_TABLE[m]
+        return RANK_TABLE[self.rank_key + RANK_KEY[card]]
+
+    def draws(self, score=None):
+        """Proiectele de culoare / chintă: outs văzute din perspectiva locului
+           (cărțile necunoscute care completează). Doar pe flop și turn."""
+        if not 5 <= self.count < 7: return NO_DRAWS
+        cat = (self.score() if score is None else score) >> 20
+        outs = set()
+        flush = straight = 0
+        if cat < 5:
+            for s, m in enumerate(self.suit_masks):
+                if bin(m).count("1") == 4:
+                    flush = 9
+                    outs.update(r * 4 + s for r in range(13) if not m >> r & 1)
+        if cat < 4:
+            ranks = self.suit_masks[0] | self.suit_masks[1] | self.suit_masks[2] | self.suit_masks[3]
+            for r in range(13):
+                if not ranks >> r & 1 and STRAIGHT_TOP[ranks | 1 << r]:
+                    straight += 4
+                    outs.update(range(r * 4, r * 4 + 4))
+        return Draws(flush, straight, len(outs))
+
+def draw_label(draws):
+    parts = []
+    if draws.flush: parts.append(f"proiect de culoare ({draws.flush} outs)")
+    if draws.straight: parts.append(f"proiect de chintă ({draws.straight} outs)")
+    if draws.flush and draws.straight: parts.append(f"{draws.outs} outs în total")
+    return ", ".join(parts)
+
+def hand_label(score, draws=NO_DRAWS):
+    label = describe_score(decode_score(score))
+    extra = draw_label(draws)
+    return f"{label} · {extra}" if extra else label
+
+# ===== Masa: contoarele tuturor locurilor =====
+def table_counters(hands, board):
+    return [HandCounters(h + tuple(board)) for h in hands]
+
+def add_street(counters, *cards):
+    for hc in counters:
+        for c in cards: hc.add(c)
+
+def table_scores(counters): return [hc.score() for hc in counters]
+
+
+if __name__ == "__main__":
+    # verificare: scorurile / proiectele incrementale == evaluarea completă pe aceleași cărți
+    import random, sys
+    from .evaluator import evaluate
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rng = random.Random(11)
+    for _ in range(n):
+        cards = rng.sample(range(52), 7)
+        hc = HandCounters(cards[:5])
+        for k in (5, 6, 7):
+            if k > 5: hc.add(cards[k - 1])
+            assert hc.score() == evaluate(cards[:k]), cards[:k]
+            if k < 7:
+                # outs = cărțile nevăzute care fac culoare / chintă pe care locul încă nu o are
+                cat = evaluate(cards[:k]) >> 20
+                def makes(c):
+                    new = cards[:k] + [c]
+                    suits = max(sum(1 for x in new if x & 3 == s) for s in range(4))
+                    ranks = 0
+                    for x in new: ranks |= 1 << (x >> 2)
+                    return (cat < 5 and suits >= 5) or (cat < 4 and STRAIGHT_TOP[ranks] > 0)
+                expected = sum(1 for c in range(52) if c not in cards[:k] and makes(c))
+                assert hc.draws().outs == expected, (cards[:k], hc.draws(), expected)
+    print(f"OK: {n} mâini, scoruri și outs identice cu evaluarea completă")
@@ -0,0 +1,91 @@
+import argparse, json, random, sys, threading, time
+
+from .cache import cache_stats, shared_cache
+from .game import new_hand_state, next_dealer, pack_state, progress_step, seat_label, unpack_state, visible_board
+from .preflop import preflop_equity
+from .render import build_table_html
+
+# ===== Test de încărcare: N sesiuni concurente, ca în modul server =====
+# Fiecare sesiune e un fir (ca în Streamlit) care apasă „Mână nouă” și apoi de 3 ori
+# „Arată …” până la showdown. Un rerun = acțiunea + ce calculează aplicația pentru
+# pagină (despachetarea stării, masa HTML, eticheta TU, equity preflop și, opțional,
+# equity Monte Carlo prin cache-ul comun). Se raportează latența p50 / p99 per rerun.
+def rerun(data, action, num_players, hero, dealer, seed, samples):
+    """Un rerun al aplicației; întoarce starea compactă nouă."""
+    if action == "new":
+        data = pack_state(new_hand_state(num_players, dealer, seed=seed))
+    elif action == "step":
+        data = pack_state(progress_step(unpack_state(data)))
+    s = unpack_state(data)
+    build_table_html(s, num_players, hero)
+    hero_hand = s["hands"][hero - 1]
+    preflop_equity(hero_hand, num_players - 1)
+    if s["stage"] != "show":
+        seat_label(s, hero - 1)
+        if samples:
+            from .equity import hero_equity
+            board = visible_board(s)
+            shared_cache("equity", 2048).get_or_compute(
+                (hero_hand, board, num_players - 1, samples, seed),
+                lambda: hero_equity(hero_hand, board, num_players - 1, samples=samples, seed=seed))
+    return data
+
+def _session(k, args, latencies, sizes, start):
+    rng = random.Random(f"{args.seed}:{k}")
+    hero = rng.randint(1, args.players)
+    dealer = 1
+    data = b""
+    start.wait()
+    for _ in range(args.hands):
+        # seed-uri dintr-un set mic -> sesiunile se suprapun parțial, ca utilizatori reali cu același seed
+        seed = rng.randrange(args.distinct_seeds) if args.distinct_seeds else None
+        for action in ("new", "step", "step", "step"):
+            t0 = time.perf_counter()
+            data = rerun(data, action, args.players, hero, dealer, seed, args.samples)
+            latencies.append(time.perf_counter() - t0)
+            if args.think: time.sleep(args.think)
+        dealer = next_dealer(dealer, args.players)
+    sizes.append(len(data))
+
+def percentile(sorted_values, p):
+    if not sorted_values: return 0.0
+    i = min(len(sorted_values) - 1, int(round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[i]
+
+def run_load(args):
+    # încălzire: tabelele (evaluator, preflop) se încarcă o dată per proces, ca engine() din aplicație
+    rerun(b"", "new", args.players, 1, 1, 0, 0)
+    latencies, sizes = [], []
+    start = threading.Event()
+    threads = [threading.Thread(target=_session, args=(k, args, latencies, sizes, start))
+               for k in range(args.sessions)]
+    for t in threads: t.start()
+    t0 = time.perf_counter(); start.set()
+    for t in threads: t.join()
+    elapsed = time.perf_counter() - t0
+    lat = sorted(latencies)
+    ms = lambda v: round(v * 1000, 3)
+    return {"sessions": args.sessions, "players": args.players, "reruns": len(lat),
+            "seconds": round(elapsed, 3), "reruns_per_sec": round(len(lat) / elapsed, 1),
+            "p50_ms": ms(percentile(lat, 50)), "p90_ms": ms(percentile(lat, 90)),
+            "p99_ms": ms(percentile(lat, 99)), "max_ms": ms(lat[-1]) if lat else 0.0,
+            "state_bytes": max(sizes) if sizes else 0, "caches": cache_stats()}
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Test de încărcare: sesiuni concurente care joacă mâini până la showdown.")
+    ap.add_argument("--sessions", type=int, default=20)
+    ap.add_argument("--hands", type=int, default=25, help="mâini per sesiune")
+    ap.add_argument("--players", type=int, default=10, choices=range(2, 11), metavar="2..10")
+    ap.add_argument("--samples", type=int, default=0, help="simulări equity per rerun (0 = fără equity)")
+    ap.add_argument("--distinct-seeds", type=int, default=50, help="câte seed-uri diferite folosesc sesiunile (0 = aleator)")
+    ap.add_argument("--think", type=float, default=0.0, help="pauză între click-uri, în secunde")
+    ap.add_argument("--seed", type=int, default=2024)
+    args = ap.parse_args(argv)
+    report = run_load(args)
+    print(f"{report['reruns']:,} rerun-uri în {report['seconds']}s ({report['reruns_per_sec']:,}/s)  "
+          f"p50 {report['p50_ms']} ms · p99 {report['p99_ms']} ms · stare {report['state_bytes']} B/sesiune",
+          file=sys.stderr)
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+if __name__ == "__main__":
+    main()
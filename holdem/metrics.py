@@ -0,0 +1,83 @@
+import functools, os, pathlib, threading, time
+from contextlib import nullcontext
+
+# ===== Instrumentare opțională (PKR_METRICS=1) =====
+# Cronometre pe etape: număr de apeluri, timp total și maxim per nume. Activarea se
+# decide o singură dată, la import: dezactivat, @timed întoarce funcția neatinsă și
+# timer() un context gol comun, deci codul instrumentat costă practic nimic.
+ENABLED = os.environ.get("PKR_METRICS", "").lower() not in ("", "0", "false", "no")
+METRICS_FILE = os.environ.get("PKR_METRICS_FILE")  # dump Prometheus după fiecare rerun, dacă e setat
+
+_NULL = nullcontext()
+_STATS = {}  # nume -> [apeluri, secunde total, secunde max]
+_LOCK = threading.Lock()
+
+def record(name, seconds):
+    with _LOCK:
+        st = _STATS.get(name)
+        if st is None: _STATS[name] = [1, seconds, seconds]
+        else:
+            st[0] += 1; st[1] += seconds
+            if seconds > st[2]: st[2] = seconds
+
+class _Timer:
+    __slots__ = ("name", "t0")
+    def __init__(self, name): self.name = name
+    def __enter__(self): self.t0 = time.perf_counter(); return self
+    def __exit__(self, *exc): record(self.name, time.perf_counter() - self.t0)
+
+def timer(name):
+    """`with timer("etapă"):` — cronometrează blocul (nimic, dacă metricile sunt oprite)."""
+    return _Timer(name) if ENABLED else _NULL
+
+def timed(name=None):
+    """Decorator: cronometrează fiecare apel al funcției sub `name` (implicit numele ei)."""
+    def deco(fn):
+        if not ENABLED: return fn
+        label = name or fn.__name__
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(label, time.perf_counter() - t0)
+        return wrapper
+    return deco
+
+def snapshot():
+    """{nume: {"count", "total", "mean", "max"}} (secunde), ordonat după timpul total."""
+    with _LOCK:
+        items = [(k, list(v)) for k, v in _STATS.items()]
+    items.sort(key=lambda kv: -kv[1][1])
+    return {k: {"count": c, "total": t, "mean": t / c, "max": m} for k, (c, t, m) in items}
+
+def reset():
+    with _LOCK: _STATS.clear()
+
+def prometheus_text(prefix="pkr_stage"):
+    """Metricile în formatul text Prometheus (summary fără cuantile + maxim ca gauge)."""
+    lines = [f"# HELP {prefix}_seconds Timpul petrecut în fiecare etapă a aplicației.",
+             f"# TYPE {prefix}_seconds summary"]
+    snap = snapshot()
+    for k, v in snap.items():
+        lines.append(f'{prefix}_seconds_count{{stage="{k}"}} {v["count"]}')
+        lines.append(f'{prefix}_seconds_sum{{stage="{k}"}} {v["total"]:.9f}')
+    lines += [f"# HELP {prefix}_seconds_max Cel mai lung apel observat, per etapă.",
+              f"# TYPE {prefix}_seconds_max gauge"]
+    lines += [f'{prefix}_seconds_max{{stage="{k}"}} {v["max"]:.9f}' for k, v in snap.items()]
+    return "\n".join(lines) + "\n"
+
+def write_prometheus(path=None):
+    # scriere atomică, ca un textfile collector să nu citească un fișier pe jumătate
+    path = pathlib.Path(path or METRICS_FILE)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(prometheus_text(), encoding="utf-8")
+    os.replace(tmp, path)
+
+def profile_text(profiler, limit=30, sort="cumulative"):
+    """Raportul pstats al unui cProfile.Profile, ca text."""
+    import io, pstats
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).strip_dirs().sort_stats(sort).print_stats(limit)
+    return out.getvalue()
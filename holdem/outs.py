@@ -0,0 +1,93 @@
+import argparse, sys, time
+from collections import namedtuple
+
+from .cache import shared_cache
+from .cards import CARD_STRS
+from .deck import remaining_cards
+from .incremental import HandCounters
+from .metrics import timed
+from .showdown import HAND_NAMES
+
+# ===== Outs pentru TU (flop / turn) =====
+# Pentru fiecare carte nevăzută, scorul cu o carte în plus vine din contoarele
+# incrementale (HandCounters.score_with: o adunare + o căutare în tabele), nu din
+# best_of_seven; pe flop sunt 47 de candidați, pe turn 46.
+Outs = namedtuple("Outs", "score by_category improving")   # by_category: {categorie: (cărți,)}
+OutsVs = namedtuple("OutsVs", "ahead win tie")              # ahead: TU conduce deja; win/tie: cărțile care aduc câștig/egal
+
+def _hero_outs(hero, board):
+    hc = HandCounters(hero + board)
+    score = hc.score()
+    cat = score >> 20
+    by_cat = {}
+    for c in remaining_cards(hero + board):
+        new = hc.score_with(c) >> 20
+        if new > cat: by_cat.setdefault(new, []).append(c)
+    by_cat = {k: tuple(v) for k, v in sorted(by_cat.items(), reverse=True)}
+    improving = tuple(sorted(c for v in by_cat.values() for c in v))
+    return Outs(score, by_cat, improving)
+
+@timed()
+def hero_outs(hero, board):
+    """Cărțile care urcă mâna `hero` într-o categorie mai bună, grupate pe categoria
+       nouă (score >> 20), pentru un board de 3 sau 4 cărți. Cache comun per (mână, board)."""
+    hero, board = tuple(sorted(hero)), tuple(sorted(board))
+    if len(board) not in (3, 4): raise ValueError("outs-urile se calculează doar pe flop sau turn")
+    return shared_cache("outs", 8192).get_or_compute((hero, board), lambda: _hero_outs(hero, board))
+
+def outs_vs(hero, opponents, board):
+    """Cu mâinile adversarilor cunoscute (ex. după showdown): cărțile care, puse pe
+       board-ul de 3/4 cărți, îi dau lui TU câștigul sau egalul pe strada următoare."""
+    hero, board = tuple(hero), tuple(board)
+    me = HandCounters(hero + board)
+    opp = [HandCounters(tuple(h) + board) for h in opponents]
+    dead = hero + board + tuple(c for h in opponents for c in h)
+    ahead = me.score() > max(o.score() for o in opp)
+    win, tie = [], []
+    for c in remaining_cards(dead):
+        mine = me.score_with(c)
+        best = max(o.score_with(c) for o in opp)
+        if mine > best: win.append(c)
+        elif mine == best: tie.append(c)
+    return OutsVs(ahead, tuple(win), tuple(tie))
+
+def outs_label(outs):
+    if not outs.improving: return "fără outs"
+    parts = [f"{HAND_NAMES[cat].split(' (')[0]}: {len(cards)}" for cat, cards in outs.by_category.items()]
+    return f"{len(outs.improving)} outs — " + ", ".join(parts)
+
+def cards_label(cards): return " ".join(CARD_STRS[c] for c in cards) or "—"
+
+
+if __name__ == "__main__":
+    # analiză în masă pe un jurnal de mâini (holdem.history): outs medii ale unui loc pe flop / turn
+    from .evaluator import evaluate
+    from .history import HandLog
+    ap = argparse.ArgumentParser(description="Outs pe flop și turn pentru un loc, pe tot jurnalul de mâini.")
+    ap.add_argument("log")
+    ap.add_argument("--seat", type=int, default=1, help="locul analizat (1-based)")
+    ap.add_argument("--limit", type=int, default=None, help="doar primele N mâini")
+    ap.add_argument("--check", type=int, default=0, help="verifică primele N mâini cu evaluarea completă")
+    args = ap.parse_args()
+    log = HandLog(args.log)
+    totals = {"flop": [0, 0, {}], "turn": [0, 0, {}]}   # mâini, outs, {categorie: outs}
+    t0 = time.perf_counter()
+    for r in log.iter_records(0, args.limit):
+        if args.seat > r.players: continue
+        hero = r.hands[args.seat - 1]
+        for street, board in (("flop", r.flop), ("turn", r.flop + (r.turn,))):
+            o = hero_outs(hero, board)
+            t = totals[street]
+            t[0] += 1; t[1] += len(o.improving)
+            for cat, cards in o.by_category.items(): t[2][cat] = t[2].get(cat, 0) + len(cards)
+            if r.index < args.check:
+                cat = evaluate(hero + board) >> 20
+                ref = sorted(c for c in remaining_cards(hero + board) if evaluate(hero + board + (c,)) >> 20 > cat)
+                assert list(o.improving) == ref, (r.index, street)
+    dt = time.perf_counter() - t0
+    for street, (n, outs, cats) in totals.items():
+        if not n: continue
+        detail = ", ".join(f"{HAND_NAMES[c].split(' (')[0]} {v / n:.2f}" for c, v in sorted(cats.items(), reverse=True))
+        print(f"{street}: {n:,} mâini · {outs / n:.2f} outs în medie ({detail})")
+    n = totals["flop"][0]
+    print(f"{n:,} mâini în {dt:.2f}s ({n / dt if dt else 0:,.0f} mâini/s, flop + turn)", file=sys.stderr)
@@ -0,0 +1,90 @@
+import argparse, pathlib, time
+
+from .cards import RANKS
+
+# ===== Tabele de equity preflop (169 clase × 1..9 adversari) =====
+# Clasa mâinii = celulă în matricea 13×13 a rangurilor: perechile pe diagonală,
+# mâinile suited deasupra diagonalei (rând = rangul mare), offsuit dedesubt.
+# Fișierul e un .npy float32 de forma (13, 13, MAX_OPPONENTS), generat o singură
+# dată cu `python -m holdem.preflop` și încărcat leneș (memory-mapped).
+MAX_OPPONENTS = 9
+TABLE_PATH = pathlib.Path(__file__).resolve().parent.parent / "assets" / "preflop_equity.npy"
+
+_TABLE = None
+
+def class_index(c1, c2):
+    """(rând, coloană) în matricea 13×13 pentru două cărți întregi."""
+    r1, r2 = c1 >> 2, c2 >> 2
+    hi, lo = max(r1, r2), min(r1, r2)
+    if (c1 & 3) == (c2 & 3): return hi, lo   # suited
+    return lo, hi                            # offsuit și perechi (culori diferite, hi == lo)
+
+def class_name(row, col):
+    if row == col: return RANKS[row] * 2
+    if row > col: return RANKS[row] + RANKS[col] + "s"
+    return RANKS[col] + RANKS[row] + "o"
+
+def class_hand(row, col):
+    """O mână reprezentativă (cărți întregi) pentru clasa dată."""
+    if row > col: return (row * 4, col * 4)            # aceeași culoare
+    hi, lo = max(row, col), min(row, col)
+    return (hi * 4, lo * 4 + 1)                        # culori diferite
+
+def load_table(path=TABLE_PATH):
+    global _TABLE
+    if _TABLE is None:
+        import numpy as np
+        _TABLE = np.load(path, mmap_mode="r")
+    return _TABLE
+
+def preflop_equity(hand, num_opponents):
+    """Equity preflop (0..1) din tabelă, sau None dacă tabela lipsește."""
+    if not 1 <= num_opponents <= MAX_OPPONENTS: return None
+    try:
+        table = load_table()
+    except OSError:
+        return None
+    row, col = class_index(*hand)
+    return float(table[row, col, num_opponents - 1])
+
+def _cell(row, col, num_opponents, samples, seed):
+    from .equity import hero_equity
+    return hero_equity(class_hand(row, col), (), num_opponents, samples=samples, seed=seed).equity
+
+def build_table(samples=50_000, seed=0, workers=1, progress=None):
+    import numpy as np
+    cells = [(r, c, k) for r in range(13) for c in range(13) for k in range(1, MAX_OPPONENTS + 1)]
+    table = np.zeros((13, 13, MAX_OPPONENTS), dtype=np.float32)
+    if workers == 1:
+        results = (_cell(r, c, k, samples, seed + i) for i, (r, c, k) in enumerate(cells))
+    else:
+        from .exact import get_pool
+        pool = get_pool(workers)
+        futures = [pool.submit(_cell, r, c, k, samples, seed + i) for i, (r, c, k) in enumerate(cells)]
+        results = (f.result() for f in futures)
+    for i, ((r, c, k), eq) in enumerate(zip(cells, results)):
+        table[r, c, k - 1] = eq
+        if progress: progress(i + 1, len(cells))
+    return table
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Generează tabela de equity preflop (169 clase × 1..9 adversari).")
+    ap.add_argument("--samples", type=int, default=50_000, help="simulări Monte Carlo per celulă")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--workers", type=int, default=1)
+    ap.add_argument("--out", type=pathlib.Path, default=TABLE_PATH)
+    args = ap.parse_args(argv)
+
+    import numpy as np
+    t0 = time.perf_counter()
+    def progress(done, total):
+        if done % 169 == 0 or done == total:
+            print(f"{done}/{total} celule, {time.perf_counter() - t0:.0f}s", flush=True)
+    table = build_table(args.samples, args.seed, args.workers, progress)
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    np.save(args.out, table)
+    for name, (r, c) in (("AA", (12, 12)), ("AKs", (12, 11)), ("72o", (0, 5))):
+        print(f"{name} ({class_name(r, c)}): " + " ".join(f"{v:.3f}" for v in table[r, c]))
+
+if __name__ == "__main__":
+    main()
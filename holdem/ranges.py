@@ -0,0 +1,214 @@
+import math, random, re
+from collections import namedtuple
+from functools import lru_cache
+from itertools import combinations
+
+import numpy as np
+
+from .batch import evaluate_batch
+from .cards import cards_mask
+from .deck import remaining_cards
+from .metrics import timed
+
+# ===== Intervale de mâini ("QQ+, AKs, A5s-A2s, KQo:0.5") =====
+# Un interval e lista combinațiilor concrete (2 cărți întregi) cu ponderea lor și
+# masca lor de 52 biți; blocajele (cărți deja văzute sau ținute de alt jucător)
+# se elimină printr-un simplu `masca & moarte`, vectorizat cu NumPy.
+RANK_CHARS = "23456789TJQKA"
+SUIT_CHARS = {"c": 0, "d": 1, "h": 2, "s": 3, "♣": 0, "♦": 1, "♥": 2, "♠": 3}
+EXACT_LIMIT = 3_000_000   # rânduri (combinații adversari × runout-uri) până la care se enumeră exact
+CHUNK = 1 << 15
+
+Range = namedtuple("Range", "text combos weights masks")   # combos (K, 2), weights (K,), masks (K,) uint64
+RangeEquity = namedtuple("RangeEquity", "win tie equity samples exact")
+
+_R = "([2-9TJQKA])"
+_CLASS = re.compile(f"^{_R}{_R}([so])?(\\+)?$", re.IGNORECASE)
+_DASH = re.compile(f"^{_R}{_R}([so])?-{_R}{_R}([so])?$", re.IGNORECASE)
+_COMBO = re.compile(f"^{_R}([cdhs♣♦♥♠]){_R}([cdhs♣♦♥♠])$", re.IGNORECASE)
+
+def _rank(ch): return RANK_CHARS.index(ch.upper())
+
+def _class_combos(hi, lo, kind):
+    """Combinațiile concrete ale clasei (rangurile 0..12; kind: "s", "o" sau None = ambele)."""
+    if hi == lo:
+        return [(hi * 4 + a, hi * 4 + b) for a, b in combinations(range(4), 2)]
+    out = []
+    if kind in (None, "s"): out += [(hi * 4 + s, lo * 4 + s) for s in range(4)]
+    if kind in (None, "o"): out += [(hi * 4 + a, lo * 4 + b) for a in range(4) for b in range(4) if a != b]
+    return out
+
+def _token_combos(tok):
+    m = _COMBO.match(tok)
+    if m:
+        r1, s1, r2, s2 = m.groups()
+        c1, c2 = _rank(r1) * 4 + SUIT_CHARS[s1.lower()], _rank(r2) * 4 + SUIT_CHARS[s2.lower()]
+        if c1 == c2: raise ValueError(f"combinație imposibilă: {tok!r}")
+        return [(max(c1, c2), min(c1, c2))]
+    m = _CLASS.match(tok)
+    if m:
+        a, b, kind, plus = m.groups()
+        kind = kind and kind.lower()
+        hi, lo = sorted((_rank(a), _rank(b)), reverse=True)
+        if hi == lo:
+            if kind: raise ValueError(f"perechile nu au s/o: {tok!r}")
+            ranks = range(hi, 13) if plus else [hi]
+            return [c for r in ranks for c in _class_combos(r, r, None)]
+        kickers = range(lo, hi) if plus else [lo]   # "ATs+" = ATs, AJs, AQs, AKs
+        return [c for k in kickers for c in _class_combos(hi, k, kind)]
+    m = _DASH.match(tok)
+    if m:
+        a1, b1, k1, a2, b2, k2 = m.groups()
+        k1, k2 = k1 and k1.lower(), k2 and k2.lower()
+        if k1 != k2: raise ValueError(f"capetele intervalului diferă (s/o): {tok!r}")
+        h1, l1 = sorted((_rank(a1), _rank(b1)), reverse=True)
+        h2, l2 = sorted((_rank(a2), _rank(b2)), reverse=True)
+        if h1 == l1 and h2 == l2:   # "99-66"
+            return [c for r in range(min(h1, h2), max(h1, h2) + 1) for c in _class_combos(r, r, None)]
+        if h1 != h2 or h1 == l1 or h2 == l2:
+            raise ValueError(f"intervalul trebuie să păstreze prima carte: {tok!r}")
+        return [c for k in range(min(l1, l2), max(l1, l2) + 1) for c in _class_combos(h1, k, k1)]
+    raise ValueError(f"nu înțeleg {tok!r} (exemple: QQ+, AKs, A5s-A2s, KQo:0.5, AhKh)")
+
+@lru_cache(maxsize=256)
+def parse_range(text):
+    """Intervalul descris de `text`; o combinație apărută de mai multe ori păstrează
+       ultima pondere. Ponderea implicită e 1; ponderea 0 scoate combinațiile."""
+    weights = {}
+    for part in text.split(","):
+        part = part.strip()
+        if not part: continue
+        tok, _, w = part.partition(":")
+        tok = tok.strip().replace("10", "T")  # doar în mână, nu și în pondere (ex. 0.10)
+        try:
+            weight = float(w) if w else 1.0
+        except ValueError:
+            raise ValueError(f"pondere invalidă în {part!r}") from None
+        if not 0.0 <= weight <= 1.0: raise ValueError(f"ponderea trebuie să fie între 0 și 1: {part!r}")
+        for c in _token_combos(tok): weights[c] = weight
+    live = [(c, w) for c, w in weights.items() if w > 0]
+    combos = np.asarray([c for c, _ in live], dtype=np.int64).reshape(-1, 2)
+    masks = (np.left_shift(np.uint64(1), combos[:, 0].astype(np.uint64)) |
+             np.left_shift(np.uint64(1), combos[:, 1].astype(np.uint64)))
+    r = Range(text, combos, np.asarray([w for _, w in live], dtype=np.float64), masks)
+    for a in r[1:]: a.setflags(write=False)
+    return r
+
+def range_size(r, dead=()):
+    """Numărul ponderat de combinații ale intervalului care nu folosesc cărțile `dead`."""
+    return float(_live(r, cards_mask(tuple(dead)))[1].sum())
+
+# ===== Equity TU contra intervalelor adversarilor =====
+def _live(r, dead):
+    keep = (r.masks & np.uint64(dead)) == 0
+    return r.combos[keep], r.weights[keep], r.masks[keep]
+
+def _shares(hero, board, runouts, villains):
+    # rânduri: board-ul complet = board + runout; scorul TU vs cei mai buni adversari
+    n = len(runouts)
+    full = np.hstack([np.broadcast_to(np.asarray(board, dtype=np.int64), (n, len(board))), runouts])
+    seats = [np.broadcast_to(np.asarray(hero, dtype=np.int64), (n, 2))] + villains
+    scores = evaluate_batch(np.concatenate([np.hstack([h, full]) for h in seats])).reshape(len(seats), n)
+    hero_s, best = scores[0], scores[1:].max(axis=0)
+    ties = (scores[1:] == hero_s).sum(axis=0)
+    win = hero_s > best
+    tie = hero_s == best
+    return win, tie, np.where(win, 1.0, np.where(tie, 1.0 / (ties + 1), 0.0))
+
+def _exact(hero, board, live):
+    # tuplurile de combinații ale adversarilor, fără cărți comune (join vectorizat pe măști)
+    cards, weights, masks = live[0]
+    for c2, w2, m2 in live[1:]:
+        ok = (masks[:, None] & m2[None, :]) == 0
+        i, j = np.nonzero(ok)
+        cards = np.hstack([cards[i], c2[j]]); weights = weights[i] * w2[j]; masks = masks[i] | m2[j]
+    deck = remaining_cards(tuple(hero) + tuple(board))
+    k = 5 - len(board)
+    runs = np.asarray(list(combinations(deck, k)), dtype=np.int64).reshape(-1, k)
+    run_masks = np.zeros(len(runs), dtype=np.uint64)
+    for col in range(k): run_masks |= np.left_shift(np.uint64(1), runs[:, col].astype(np.uint64))
+
+    win = tie = eq = total = 0.0; rows = 0
+    step = max(1, CHUNK // max(len(runs), 1))
+    for lo in range(0, len(cards), step):
+        ok = (masks[lo:lo + step, None] & run_masks[None, :]) == 0
+        i, j = np.nonzero(ok)
+        if not len(i): continue
+        i += lo
+        w = weights[i]
+        villains = [cards[i, 2 * v: 2 * v + 2] for v in range(len(live))]
+        wi, ti, sh = _shares(hero, board, runs[j], villains)
+        win += float(w[wi].sum()); tie += float(w[ti].sum()); eq += float((w * sh).sum()); total += float(w.sum())
+        rows += len(i)
+    if not total: raise ValueError("intervalele nu au combinații compatibile între ele")
+    return RangeEquity(win / total, tie / total, eq / total, rows, True)
+
+def _monte_carlo(hero, board, live, samples, gen):
+    deck = np.asarray(remaining_cards(tuple(hero) + tuple(board)), dtype=np.int64)
+    pos = np.full(52, -1, dtype=np.int64); pos[deck] = np.arange(len(deck))
+    probs = [w / w.sum() for _, w, _ in live]
+    k = 5 - len(board)
+    wins = ties = 0; total = 0.0; done = 0; tries = 0
+    while done < samples:
+        n = min(CHUNK, samples - done)
+        picks = [gen.choice(len(w), size=n, p=p) for (_, w, _), p in zip(live, probs)]
+        masks = np.zeros(n, dtype=np.uint64); ok = np.ones(n, dtype=bool)
+        for (_, _, m), idx in zip(live, picks):
+            ok &= (masks & m[idx]) == 0
+            masks |= m[idx]
+        tries += n
+        if not ok.any():
+            if tries > 50 * samples: raise ValueError("intervalele nu au combinații compatibile între ele")
+            continue
+        villains = [c[idx[ok]] for (c, _, _), idx in zip(live, picks)]
+        m = int(ok.sum())
+        if k:
+            vals = gen.random((m, len(deck)))
+            for v in villains: vals[np.arange(m)[:, None], pos[v]] = 2.0   # cărțile adversarilor nu ies pe board
+            runs = deck[np.argpartition(vals, k - 1, axis=1)[:, :k]]
+        else:
+            runs = np.empty((m, 0), dtype=np.int64)
+        win, tie, share = _shares(hero, board, runs, villains)
+        wins += int(win.sum()); ties += int(tie.sum()); total += float(share.sum()); done += m
+    return RangeEquity(wins / done, ties / done, total / done, done, False)
+
+@timed()
+def range_equity(hero, ranges, board=(), samples=100_000, seed=None, rng=None, exact_limit=EXACT_LIMIT):
+    """Equity-ul mâinii `hero` contra câte unui interval per adversar (text sau Range).
+       Enumerare exactă dacă (combinații adversari × runout-uri) <= `exact_limit`,
+       altfel `samples` simulări Monte Carlo (ponderate; seed ca în hero_equity)."""
+    board = tuple(board)
+    ranges = [parse_range(r) if isinstance(r, str) else r for r in ranges]
+    if not ranges: raise ValueError("cel puțin un interval de adversar")
+    dead = cards_mask(tuple(hero) + board)
+    live = [_live(r, dead) for r in ranges]
+    for r, (c, _, _) in zip(ranges, live):
+        if not len(c): raise ValueError(f"intervalul {r.text!r} nu are combinații compatibile cu cărțile TU / board")
+    left = 52 - 2 - len(board)
+    space = math.prod(len(c) for c, _, _ in live) * math.comb(left, 5 - len(board))
+    if space <= exact_limit:
+        return _exact(hero, board, live)
+    rng = rng or random.Random(seed)
+    return _monte_carlo(hero, board, live, samples, np.random.default_rng(rng.getrandbits(64)))
+
+
+if __name__ == "__main__":
+    # exact vs Monte Carlo pe eșantioane mari (parsarea e în tests/test_ranges.py)
+    import time
+    from .cards import cards_to_ints
+    hero = tuple(cards_to_ints(["A♠", "A♥"]))
+    t0 = time.perf_counter()
+    pre = range_equity(hero, ["KK"], samples=200_000, seed=1)
+    print(f"AA vs KK preflop (MC): {pre.equity:.3f} (~0.82)  {time.perf_counter() - t0:.2f}s")
+    board = tuple(cards_to_ints(["K♣", "7♦", "2♠"]))
+    t0 = time.perf_counter()
+    ex = range_equity(hero, ["QQ+, AKs, KQo:0.5"], board)
+    t1 = time.perf_counter()
+    mc = range_equity(hero, ["QQ+, AKs, KQo:0.5"], board, samples=200_000, seed=2, exact_limit=0)
+    print(f"flop exact {ex.equity:.4f} ({t1 - t0:.2f}s) vs MC {mc.equity:.4f} ({time.perf_counter() - t1:.2f}s)")
+    assert abs(ex.equity - mc.equity) < 0.01
+    three = range_equity(hero, ["QQ+, AKs", "77+, AJs+"], board, samples=100_000, seed=3, exact_limit=0)
+    three_ex = range_equity(hero, ["QQ+, AKs", "77+, AJs+"], board)
+    print(f"3 jucători: exact {three_ex.equity:.4f} vs MC {three.equity:.4f}")
+    assert abs(three.equity - three_ex.equity) < 0.01
+    print("OK")
@@ -0,0 +1,114 @@
+from functools import lru_cache
+import math
+
+from .cards import RANK_STR, SUIT_STR, IS_RED
+from .metrics import timed
+
+CARD_SCALE_PLAYERS = 2.5
+CARD_SCALE_BOARD   = 2.0
+# și folosește scale=CARD_SCALE_BOARD pentru board, respectiv CARD_SCALE_PLAYERS pentru jucători.
+
+# ===== UI helpers (HTML cards) =====
+# Stilul cărților stă în assets/styles.css (.card + mărimile .card-board / .card-seat);
+# HTML-ul unei cărți depinde doar de argumente, deci fiecare fragment se construiește
+# o singură dată per proces (52 cărți x variante), nu la fiecare rerun.
+SIZE_CLASSES = {(True, CARD_SCALE_BOARD): "card-board", (False, CARD_SCALE_PLAYERS): "card-seat"}
+
+def _size_style(big, scale):
+    # doar pentru mărimi fără clasă în CSS (altă scală decât board / jucători)
+    base_pad = (8, 10) if big else (4, 8)
+    base_font = 26 if big else 16
+    return (f" style='margin:{int(2*scale)}px;padding:{int(base_pad[0]*scale)}px {int(base_pad[1]*scale)}px;"
+            f"border-radius:{int(6*scale)}px;font-size:{int(base_font*scale)}px'")
+
+def _card_attrs(classes, big, scale):
+    size = SIZE_CLASSES.get((big, scale))
+    if size: return f"class='card {size}{classes}'"
+    return f"class='card{classes}'{_size_style(big, scale)}"
+
+@lru_cache(maxsize=None)
+def card_html(card, big=False, highlight=False, border=False, scale=1.0):
+    # `card` e întreg 0..51; textul se construiește doar aici, la randare
+    classes = (" red" if IS_RED[card] else "") + (" hl" if highlight else "") + (" win" if border else "")
+    return f"<span {_card_attrs(classes, big, scale)}>{RANK_STR[card]}{SUIT_STR[card]}</span>"
+
+@lru_cache(maxsize=None)
+def hidden_html(big=False, scale=1.0):
+    return f"<span {_card_attrs(' back', big, scale)}>🂠</span>"
+
+# ===== Geometria mesei (per număr de jucători) =====
+@lru_cache(maxsize=None)
+def seat_geometry(num_players):
+    """(x, y) în procente pentru fiecare loc și poziția chip-ului de dealer în fața lui."""
+    seats, chips = [], []
+    for i in range(num_players):
+        # 0° sus, sens orar; offset -90° ca jos să fie ~270°
+        angle = (360 * i / num_players)
+        radius = 46
+        x = 50 + radius * math.cos(math.radians(angle - 90))
+        y = 50 + radius * math.sin(math.radians(angle - 90))
+        seats.append((x, y))
+        # chip-ul dealer-ului: spre interiorul mesei (interpolare către centru)
+        alpha = 0.70  # 0.78..0.90 — mai mare = mai aproape de scaun; mai mic = mai aproape de centru
+        chips.append((50 * (1 - alpha) + alpha * x, 50 * (1 - alpha) + alpha * y))
+    return tuple(seats), tuple(chips)
+
+# ===== Masa (HTML) =====
+TABLE_TEMPLATE = (
+    "<div class='table-wrap'><div class='poker-table'>"
+    "<div class='table-logo'>Texas Hold'em</div>"
+    "<div class='board-cards'>{board}</div>{seats}{chips}"
+    "</div></div>"
+)
+
+@timed()
+def build_table_html(s, num_players, hero):
+    """HTML-ul mesei pentru starea mâinii `s` (board, locuri, chip dealer)."""
+    stage, show = s["stage"], s["show"]
+    winners = s.get("winners", [])
+
+    # === Board (cu highlight pe cărțile din combo câștigătoare) ===
+    board_highlight_set = set()
+    if show and s["winner_combos"]:
+        for combo in s["winner_combos"]: board_highlight_set.update(combo)
+
+    visible = {"flop": 3, "turn": 4}.get(stage, 5)
+    board = []
+    for k, c in enumerate(s["flop"] + (s["turn"], s["river"])):
+        if k < visible:
+            hl = show and c in board_highlight_set
+            board.append(card_html(c, big=True, highlight=hl, border=hl, scale=CARD_SCALE_BOARD))
+        else:
+            board.append(hidden_html(big=True, scale=CARD_SCALE_BOARD))
+
+    # === Jucători în jurul mesei ===
+    seats_xy, chips_xy = seat_geometry(num_players)
+    hidden_pair = hidden_html(scale=CARD_SCALE_PLAYERS) * 2
+    player_seats = []
+    for i, (x, y) in enumerate(seats_xy):
+        is_hero = (i + 1) == hero
+        is_winner = show and i in winners
+        # cărțile din combo-ul câștigător al locului (doar pentru câștigători)
+        combo_set = set(s["winner_combos"][winners.index(i)]) if is_winner and s["winner_combos"] else ()
+
+        label = "TU" if is_hero else f"Jucător {i+1}"
+        if (i + 1) == s["dealer"]: label += " (D)"
+        if is_winner: label += " 🏆"
+        cls = "player-badge hero" if is_hero else "player-badge"
+
+        # cărți vizibile: TU mereu; ceilalți la showdown
+        if is_hero or stage == "show":
+            cards_html = "".join(card_html(c, highlight=is_winner and c in combo_set, scale=CARD_SCALE_PLAYERS)
+                                 for c in s["hands"][i])
+        else:
+            cards_html = hidden_pair
+        player_seats.append(
+            f"<div class='player-seat' style='left:{x:.2f}%;top:{y:.2f}%'>"
+            f"<div class='{cls}'>{label}</div>"
+            f"<div class='player-cards'>{cards_html}</div></div>"
+        )
+
+    d = s["dealer"] - 1
+    chips = f"<div class='dealer-chip' style='left:{chips_xy[d][0]:.2f}%;top:{chips_xy[d][1]:.2f}%'>D</div>" \
+        if 0 <= d < num_players else ""
+    return TABLE_TEMPLATE.format(board=" ".join(board), seats="".join(player_seats), chips=chips)
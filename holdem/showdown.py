@@ -0,0 +1,54 @@
+from .cache import shared_cache
+from .canonical import canonical_key
+from .cards import VAL_RANK
+from .evaluator import best_combo, decode_score
+from .metrics import timed
+
+# ===== Descriere & showdown =====
+HAND_NAMES = {
+    8: "Chintă de culoare (Straight Flush)",
+    7: "Careu (Four of a Kind)",
+    6: "Full (Full House)",
+    5: "Culoare (Flush)",
+    4: "Chintă (Straight)",
+    3: "Trei de un fel / Trips (Three of a Kind)",
+    2: "Două perechi (Two Pair)",
+    1: "O pereche (One Pair)",
+    0: "Carte mare (High Card)",
+}
+def to_rank_str(v): return VAL_RANK[v]
+def straight_str(topv): return "5–A" if topv == 5 else "–".join(to_rank_str(topv - i) for i in range(5))
+
+def describe_score(score):
+    t = score[0]
+    if t == 8: return f"{HAND_NAMES[t]} – {straight_str(score[1])}"
+    if t == 7: return f"{HAND_NAMES[t]} – {to_rank_str(score[1])} cu kicker {to_rank_str(score[2])}"
+    if t == 6: return f"{HAND_NAMES[t]} – {to_rank_str(score[1])} peste {to_rank_str(score[2])}"
+    if t == 5: return f"{HAND_NAMES[t]} – " + " ".join(to_rank_str(v) for v in score[1][:5])
+    if t == 4: return f"{HAND_NAMES[t]} – {straight_str(score[1])}"
+    if t == 3: return f"{HAND_NAMES[t]} – {to_rank_str(score[1])}"
+    if t == 2:
+        p1, p2 = to_rank_str(score[1][0]), to_rank_str(score[1][1])
+        return f"{HAND_NAMES[t]} – {p1} și {p2}, kicker {to_rank_str(score[2])}"
+    if t == 1: return f"{HAND_NAMES[t]} – {to_rank_str(score[1])}"
+    return f"{HAND_NAMES[0]} – " + " ".join(to_rank_str(v) for v in score[1][:5])
+
+@timed()
+def winner_details_with_combos(hands, board5):
+    # toate locurile evaluate dintr-un singur apel vectorizat; scorurile nu depind de
+    # culori, deci mesele izomorfe (ex. același seed) le iau din cache-ul comun
+    from .batch import evaluate_batch  # NumPy se încarcă abia la primul showdown
+    cards7 = [h + board5 for h in hands]
+    scored = shared_cache("showdown", 4096).get_or_compute(
+        canonical_key(hands, board5), lambda: evaluate_batch(cards7).tolist())
+    return showdown_from_scores(cards7, scored)
+
+@timed()
+def showdown_from_scores(cards7, scored):
+    """Câștigătorii, descrierile și combinațiile lor din scorurile deja calculate
+       (ex. de contoarele incrementale din holdem.incremental)."""
+    best = max(scored)
+    winners = [i for i, s in enumerate(scored) if s == best]
+    desc = [describe_score(decode_score(scored[i])) for i in winners]
+    winner_combos = [[cards7[i][j] for j in best_combo(cards7[i], scored[i])] for i in winners]
+    return winners, desc, winner_combos
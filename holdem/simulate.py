@@ -0,0 +1,177 @@
+import argparse, csv, json, os, pathlib, random, sys, time
+from concurrent.futures import FIRST_COMPLETED, wait
+from itertools import islice
+
+from .cards import CARD_STRS
+from .deck import SHUFFLE_MODES, iter_deals
+from .evaluator import decode_score
+from .showdown import describe_score
+from .stats import SessionStats
+
+# ===== Simulare în masă, fără browser =====
+# Mâinile se împart în bucăți (chunk-uri) de `chunk_size`; bucata k are propriul
+# random.Random(f"{seed}:{k}") și dealerul continuă rotația globală, deci fiecare
+# bucată se poate genera independent (în paralel sau la reluare) cu același rezultat.
+# Un chunk terminat = un fișier final; la --resume fișierele existente se sar.
+# Lângă fiecare chunk se scriu statisticile lui (holdem.stats), de mărime fixă;
+# la final se combină în stats.json, indiferent câți workeri le-au produs.
+COLUMNS = ["hand", "dealer", "board", "hands", "winners", "category", "description"]
+BATCH = 4096
+
+def chunk_path(out_dir, k, fmt): return out_dir / f"chunk-{k:06d}.{fmt}"
+
+def stats_path(out_dir, k): return out_dir / f"chunk-{k:06d}.stats.json"
+
+def _fmt_cards(cards): return " ".join(CARD_STRS[c] for c in cards)
+
+def iter_rows(players, seed, chunk, chunk_size, count, dealer=1, rotate=True, mode="riffle", stats=None):
+    """Rândurile (dict-uri) pentru bucata `chunk`: împărțire ca în new_hand,
+       showdown ca în winner_details_with_combos, evaluat vectorizat pe loturi.
+       Cu `stats` (holdem.stats.SessionStats), fiecare lot se adaugă și acolo."""
+    import numpy as np
+    from .batch import evaluate_batch
+    first = chunk * chunk_size
+    start_dealer = ((dealer - 1 + first) % players) + 1 if rotate else dealer
+    deals = iter_deals(players, f"{seed}:{chunk}", count, start_dealer, rotate, mode)
+    hand_id = first
+    while True:
+        batch = list(islice(deals, BATCH))
+        if not batch: return
+        cards = np.asarray([h + d.flop + (d.turn, d.river) for d in batch for h in d.hands])
+        scores = evaluate_batch(cards).reshape(len(batch), players)
+        if stats is not None: stats.add_batch([d.dealer for d in batch], scores)
+        best = scores.max(axis=1)
+        for d, row, b in zip(batch, scores.tolist(), best.tolist()):
+            winners = [i + 1 for i, sc in enumerate(row) if sc == b]
+            yield {"hand": hand_id, "dealer": d.dealer,
+                   "board": _fmt_cards(d.flop + (d.turn, d.river)),
+                   "hands": "|".join(_fmt_cards(h) for h in d.hands),
+                   "winners": ";".join(map(str, winners)), "category": b >> 20,
+                   "description": describe_score(decode_score(b))}
+            hand_id += 1
+
+def _write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=COLUMNS)
+        w.writeheader()
+        for r in rows: w.writerow(r)
+
+def _write_parquet(path, rows):
+    try:
+        import pyarrow as pa, pyarrow.parquet as pq
+    except ImportError:
+        raise SystemExit("formatul parquet cere pyarrow (pip install pyarrow)")
+    writer = None
+    try:
+        while True:
+            part = list(islice(rows, BATCH * 4))
+            if not part: break
+            table = pa.Table.from_pylist(part)
+            if writer is None: writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None: writer.close()
+
+WRITERS = {"csv": _write_csv, "parquet": _write_parquet}
+
+def run_chunk(params, chunk):
+    """Generează și scrie bucata `chunk` (atomic: fișier temporar + rename), apoi
+       statisticile ei; chunk-ul apare ultimul, deci existența lui = bucată completă."""
+    out_dir = pathlib.Path(params["out"])
+    path = chunk_path(out_dir, chunk, params["format"])
+    count = min(params["chunk_size"], params["hands"] - chunk * params["chunk_size"])
+    stats = SessionStats()
+    rows = iter_rows(params["players"], params["seed"], chunk, params["chunk_size"], count,
+                     params["dealer"], params["rotate"], params["mode"], stats)
+    tmp = path.with_name(path.name + ".tmp")
+    WRITERS[params["format"]](tmp, rows)
+    stats.save(stats_path(out_dir, chunk))
+    os.replace(tmp, path)
+    return chunk, count
+
+def _manifest(out_dir, params, resume):
+    # directorul nu intră în manifest: o simulare mutată se poate relua
+    params = {k: v for k, v in params.items() if k != "out"}
+    path = out_dir / "manifest.json"
+    if path.exists():
+        old = json.loads(path.read_text(encoding="utf-8"))
+        if not resume:
+            raise SystemExit(f"{out_dir} conține deja o simulare; folosește --resume sau alt director")
+        if old != params:
+            raise SystemExit(f"parametrii diferă de cei din {path}; reluarea ar amesteca simulări")
+        return
+    path.write_text(json.dumps(params, indent=2) + "\n", encoding="utf-8")
+
+def simulate(params, workers=1, log=None):
+    out_dir = pathlib.Path(params["out"])
+    total_chunks = -(-params["hands"] // params["chunk_size"])
+    todo = [k for k in range(total_chunks) if not chunk_path(out_dir, k, params["format"]).exists()]
+    if log and len(todo) < total_chunks: log(f"reluare: {total_chunks - len(todo)} bucăți deja gata")
+    done_hands = 0; t0 = time.perf_counter()
+
+    def report(chunk, count):
+        nonlocal done_hands
+        done_hands += count
+        if log: log(f"bucata {chunk} gata; {done_hands:,} mâini, {done_hands / (time.perf_counter() - t0):,.0f} mâini/s")
+
+    if workers == 1:
+        for k in todo: report(*run_chunk(params, k))
+    else:
+        _run_parallel(params, todo, workers, report)
+    return merge_stats(out_dir, total_chunks, log)
+
+def merge_stats(out_dir, total_chunks, log=None):
+    """Combină statisticile bucăților în stats.json (bucățile fără statistici se raportează)."""
+    total, missing = SessionStats(), []
+    for k in range(total_chunks):
+        p = stats_path(out_dir, k)
+        if p.exists(): total.merge(SessionStats.load(p))
+        else: missing.append(k)
+    total.save(out_dir / "stats.json")
+    if log and missing: log(f"fără statistici pentru {len(missing)} bucăți (ex. {missing[0]}), scrise înaintea lor")
+    return total
+
+def _run_parallel(params, todo, workers, report):
+    from .exact import get_pool
+    pool = get_pool(workers)
+    pending = set(); it = iter(todo)
+    # cel mult 2 bucăți în zbor per worker -> memorie mărginită
+    for k in islice(it, workers * 2): pending.add(pool.submit(run_chunk, params, k))
+    while pending:
+        finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for f in finished:
+            report(*f.result())
+            for k in islice(it, 1): pending.add(pool.submit(run_chunk, params, k))
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Simulează mâini de Texas Hold'em fără browser și le scrie pe disc.")
+    ap.add_argument("--players", type=int, default=10, choices=range(2, 11), metavar="2..10")
+    ap.add_argument("--seed", type=int, default=None, help="implicit: aleator (salvat în manifest)")
+    ap.add_argument("--hands", type=int, required=True)
+    ap.add_argument("--workers", type=int, default=1)
+    ap.add_argument("--out", type=pathlib.Path, required=True, help="director pentru bucăți + manifest.json")
+    ap.add_argument("--format", choices=list(WRITERS), default="csv")
+    ap.add_argument("--chunk-size", type=int, default=100_000)
+    ap.add_argument("--dealer", type=int, default=1, help="dealerul primei mâini (1-based)")
+    ap.add_argument("--no-rotate", action="store_true", help="dealerul nu se rotește")
+    ap.add_argument("--mode", choices=SHUFFLE_MODES, default="riffle")
+    ap.add_argument("--resume", action="store_true", help="continuă după ultima bucată terminată")
+    args = ap.parse_args(argv)
+
+    seed = args.seed
+    manifest = args.out / "manifest.json"
+    if seed is None and args.resume and manifest.exists():
+        seed = json.loads(manifest.read_text(encoding="utf-8"))["seed"]
+    if seed is None: seed = random.SystemRandom().getrandbits(63)
+    params = {"players": args.players, "seed": seed, "hands": args.hands, "chunk_size": args.chunk_size,
+              "dealer": args.dealer, "rotate": not args.no_rotate, "mode": args.mode,
+              "format": args.format, "out": str(args.out.resolve())}
+    args.out.mkdir(parents=True, exist_ok=True)
+    _manifest(args.out, params, args.resume)
+    stats = simulate(params, args.workers, log=lambda m: print(m, file=sys.stderr, flush=True))
+    best = max(stats.seat_rows(), key=lambda r: r["cota din pot"], default=None)
+    if best: print(f"statistici: {args.out / 'stats.json'} (cea mai mare cotă din pot: locul {best['loc']}, "
+                   f"{best['cota din pot']:.1%})", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
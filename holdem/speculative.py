@@ -0,0 +1,94 @@
+import os, threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+from .game import compute_now, full_board, hand_key
+from .incremental import table_counters, table_scores
+from .metrics import timed
+from .showdown import showdown_from_scores
+from .texture import legend_possibles_on_river
+
+# ===== Calcul speculativ: river și showdown pornite în fundal la împărțire =====
+# Board-ul întreg se știe din momentul în care new_hand împarte cărțile; ce va cere
+# „Arată River” (posibilele de pe board-ul complet) și „Arată cărțile” (câștigătorii)
+# se poate calcula deja pe un fir din fundal. Click-ul doar culege rezultatul: dacă
+# lucrul rulează, îl așteaptă; dacă n-a pornit încă (coada e comună tuturor sesiunilor)
+# sau a fost anulat, îl calculează pe loc, deci un click nu stă după lucrul altora.
+# Lucrul scump (equity Monte Carlo) are pool-ul lui, ca să nu întârzie river / showdown.
+WORKERS = int(os.environ.get("PKR_SPEC_WORKERS", "2"))
+
+_EXECUTORS = {}
+_EXECUTOR_LOCK = threading.Lock()
+
+def executor(slow=False):
+    """Pool-ul comun al procesului (toate sesiunile), creat la prima cerere; `slow`
+       = pool-ul separat pentru lucrul lung."""
+    with _EXECUTOR_LOCK:
+        pool = _EXECUTORS.get(slow)
+        if pool is None:
+            pool = _EXECUTORS[slow] = ThreadPoolExecutor(
+                max_workers=WORKERS, thread_name_prefix="pkr-spec-slow" if slow else "pkr-spec")
+        return pool
+
+@timed("speculative_showdown")
+def _showdown(hands, board):
+    # aceleași scoruri ca progress_step (contoare incrementale pe board-ul complet)
+    scores = table_scores(table_counters(hands, board))
+    return showdown_from_scores([h + board for h in hands], scores)
+
+def hand_tasks(s):
+    """Lucrul de motor pentru mâna din `s`, pe numele folosite de game.progress_step."""
+    hands, board = s["hands"], full_board(s)
+    return {"river": lambda: legend_possibles_on_river(board),
+            "showdown": lambda: _showdown(hands, board)}
+
+class Speculation:
+    """Rezultatele viitoare ale unei mâini. `cancel` (threading.Event) e transmis și
+       lucrului care știe să se oprească singur (ex. hero_equity), nu doar cozii."""
+
+    def __init__(self, s, tasks=None):
+        self.key = hand_key(s)
+        self.cancel_event = threading.Event()
+        self.futures = {}
+        self.submit(tasks if tasks is not None else hand_tasks(s))
+
+    def submit(self, tasks, slow=False):
+        pool = executor(slow)
+        for name, fn in tasks.items():
+            if name not in self.futures: self.futures[name] = pool.submit(fn)
+
+    def collect(self, name, compute):
+        """Rezultatul lui `name` din fundal; `compute()` pe loc dacă nu există sau a fost anulat."""
+        f = self.futures.get(name)
+        if f is None or self.cancel_event.is_set() or f.cancel(): return compute()  # cancel() = n-a pornit
+        try:
+            return f.result()
+        except CancelledError:
+            return compute()
+
+    def cancel(self):
+        # ce n-a pornit iese din coadă; ce rulează vede evenimentul și se oprește
+        self.cancel_event.set()
+        for f in self.futures.values(): f.cancel()
+
+def collector(spec, data):
+    """`collect` pentru progress_step / unpack_state: al speculației, dacă ea e pentru mâna
+       din `data` (starea sau forma compactă), altfel calculul pe loc."""
+    return spec.collect if spec is not None and spec.key == hand_key(data) else compute_now
+
+
+if __name__ == "__main__":
+    # verificare: rezultatele culese din fundal = calculul sincron din progress_step
+    import random, sys, time
+    from .game import hand_state, new_hand_state, progress_step
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    rng = random.Random(7)
+    t0 = time.perf_counter()
+    for i in range(n):
+        s = new_hand_state(rng.randint(2, 10), 1, rng=rng)
+        ref = hand_state(s["dealer"], s["hands"], s["flop"], s["turn"], s["river"])
+        spec = Speculation(s)
+        if i % 10 == 0: spec.cancel()  # anulat: click-ul calculează pe loc
+        for _ in range(3): progress_step(s, spec.collect); progress_step(ref)
+        for k in ("possible_river", "winners", "winner_descriptions", "winner_combos"):
+            assert s[k] == ref[k], (i, k)
+    print(f"OK: {n} mâini în {time.perf_counter() - t0:.2f}s")
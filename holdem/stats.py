@@ -0,0 +1,199 @@
+import argparse, json, os, pathlib, sys, time
+
+import numpy as np
+
+from .texture import CATEGORY_LEGEND, LEGEND_TEXT, ROYAL_LEGEND
+
+# ===== Statistici pe sesiuni lungi: acumulatori de mărime fixă, combinabili =====
+# Nimic nu crește cu numărul de mâini: pentru fiecare loc și fiecare poziție față de
+# dealer se țin contoare int64 (mâini, câștiguri singur, split-uri, cota din pot),
+# plus frecvența id-urilor din legendă (texture.score_to_legend_ids) per loc și pentru
+# mâna câștigătoare. Cota unui split de k jucători e SHARE_UNIT // k, deci rămâne
+# întreagă și exactă; două acumulatoare se adună câmp cu câmp (workeri în paralel).
+MAX_SEATS = 10
+SHARE_UNIT = 2520  # cmmmc(1..10)
+LEGEND_IDS = 11    # id-uri 1..10, coloana 0 nefolosită
+# texture.CATEGORY_LEGEND ca tablou indexat după categorie (score >> 20)
+LEGEND_BY_CATEGORY = np.array([CATEGORY_LEGEND[c] for c in range(len(CATEGORY_LEGEND))], dtype=np.int64)
+VERSION = 1
+
+FIELDS = ("seat_hands", "seat_wins", "seat_splits", "seat_share", "seat_legend",
+          "pos_hands", "pos_wins", "pos_splits", "pos_share", "win_legend")
+
+def legend_ids(scores):
+    """Id-ul din legendă (1..10) pentru fiecare scor împachetat, vectorizat."""
+    scores = np.asarray(scores, dtype=np.int64)
+    cat = scores >> 20
+    ids = LEGEND_BY_CATEGORY[cat]
+    ids[(cat == 8) & ((scores >> 16) & 0xF == 14)] = ROYAL_LEGEND
+    return ids
+
+def position_name(pos): return "Dealer" if pos == 0 else f"Dealer+{pos}"
+
+def _rate(part, whole): return float(part / whole) if whole else 0.0
+
+class SessionStats:
+    """Statistici pe locuri și poziții pentru oricâte mâini, în memorie constantă."""
+    __slots__ = ("hands",) + FIELDS
+
+    def __init__(self):
+        self.hands = 0
+        for f in FIELDS:
+            shape = (MAX_SEATS, LEGEND_IDS) if f == "seat_legend" else (LEGEND_IDS,) if f == "win_legend" else (MAX_SEATS,)
+            setattr(self, f, np.zeros(shape, dtype=np.int64))
+
+    def add_batch(self, dealers, scores):
+        """`scores`: tablou (H, n) de scoruri la showdown, `dealers`: (H,) dealerul 1-based."""
+        scores = np.asarray(scores, dtype=np.int64)
+        hands, n = scores.shape
+        if not hands: return self
+        dealers = np.asarray(dealers, dtype=np.int64)
+        best = scores.max(axis=1)
+        won = scores == best[:, None]
+        k = won.sum(axis=1)
+        solo, split = won & (k == 1)[:, None], won & (k > 1)[:, None]
+        share = np.where(won, SHARE_UNIT // k[:, None], 0)
+        pos = (np.arange(n)[None, :] - dealers[:, None] + 1) % n   # 0 = dealerul, 1 = stânga lui, ...
+        ids = legend_ids(scores)
+
+        self.hands += hands
+        self.seat_hands[:n] += hands
+        self.seat_wins[:n] += solo.sum(axis=0)
+        self.seat_splits[:n] += split.sum(axis=0)
+        self.seat_share[:n] += share.sum(axis=0)
+        self.seat_legend[:n] += np.bincount((np.arange(n) * LEGEND_IDS + ids).ravel(),
+                                            minlength=n * LEGEND_IDS).reshape(n, LEGEND_IDS)
+        self.pos_hands += np.bincount(pos.ravel(), minlength=MAX_SEATS)
+        self.pos_wins += np.bincount(pos[solo], minlength=MAX_SEATS)
+        self.pos_splits += np.bincount(pos[split], minlength=MAX_SEATS)
+        np.add.at(self.pos_share, pos.ravel(), share.ravel())
+        self.win_legend += np.bincount(legend_ids(best), minlength=LEGEND_IDS)
+        return self
+
+    def add(self, dealer, scores):
+        """O singură mână (scorurile locurilor, în ordine)."""
+        return self.add_batch([dealer], [scores])
+
+    def merge(self, other):
+        self.hands += other.hands
+        for f in FIELDS: getattr(self, f).__iadd__(getattr(other, f))
+        return self
+    __iadd__ = merge
+
+    def __eq__(self, other):
+        return (isinstance(other, SessionStats) and self.hands == other.hands
+                and all(np.array_equal(getattr(self, f), getattr(other, f)) for f in FIELDS))
+
+    # ----- serializare (JSON: rezultate parțiale de la workeri / bucăți de simulare) -----
+    def to_dict(self):
+        return {"version": VERSION, "hands": self.hands, **{f: getattr(self, f).tolist() for f in FIELDS}}
+
+    @classmethod
+    def from_dict(cls, d):
+        if d.get("version") != VERSION: raise ValueError(f"statistici v{d.get('version')}, aștept v{VERSION}")
+        st = cls()
+        st.hands = d["hands"]
+        for f in FIELDS: setattr(st, f, np.asarray(d[f], dtype=np.int64).reshape(getattr(st, f).shape))
+        return st
+
+    def save(self, path):
+        path = pathlib.Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path): return cls.from_dict(json.loads(pathlib.Path(path).read_text(encoding="utf-8")))
+
+    # ----- rapoarte -----
+    def seat_rows(self):
+        rows = []
+        for i in range(MAX_SEATS):
+            n = int(self.seat_hands[i])
+            if not n: continue
+            top = int(np.argmax(self.seat_legend[i][1:])) + 1
+            rows.append({"loc": i + 1, "mâini": n, "câștig": _rate(self.seat_wins[i], n),
+                         "split": _rate(self.seat_splits[i], n), "cota din pot": _rate(self.seat_share[i], n * SHARE_UNIT),
+                         "cea mai des": LEGEND_TEXT[top]})
+        return rows
+
+    def position_rows(self):
+        return [{"poziție": position_name(p), "mâini": int(n), "câștig": _rate(self.pos_wins[p], n),
+                 "split": _rate(self.pos_splits[p], n), "cota din pot": _rate(self.pos_share[p], n * SHARE_UNIT)}
+                for p, n in enumerate(self.pos_hands) if n]
+
+    def category_rows(self):
+        seats = self.seat_legend.sum(axis=0)
+        total, hands = int(seats.sum()), self.hands
+        return [{"mână": LEGEND_TEXT[i], "la showdown": _rate(seats[i], total),
+                 "câștigătoare": _rate(self.win_legend[i], hands)} for i in range(1, LEGEND_IDS)]
+
+def stats_from_log(log, start=0, stop=None, stats=None, batch=65536):
+    """Adaugă mâinile [start, stop) din jurnalul holdem.history.HandLog, pe loturi
+       evaluate vectorizat (grupate după numărul de jucători)."""
+    from .batch import evaluate_batch
+    from .history import MAX_SEATS as LOG_SEATS
+    stats = stats if stats is not None else SessionStats()
+    buf = []
+
+    def flush():
+        v = np.asarray(buf, dtype=np.int64)
+        board = v[:, 5 + 2 * LOG_SEATS:]
+        for n in np.unique(v[:, 2]).tolist():
+            g = v[:, 2] == n
+            holes = v[g, 5:5 + 2 * n].reshape(-1, n, 2)
+            boards = np.broadcast_to(board[g][:, None, :], (len(holes), n, 5))
+            scores = evaluate_batch(np.concatenate([holes, boards], axis=2).reshape(-1, 7))
+            stats.add_batch(v[g, 3], scores.reshape(-1, n))
+        buf.clear()
+
+    for _, values in log.iter_values(start, stop, batch):
+        buf.append(values)
+        if len(buf) == batch: flush()
+    if buf: flush()
+    return stats
+
+def load_stats(path):
+    """Statistici dintr-un fișier .json, dintr-un director de simulare (bucățile se
+       combină) sau dintr-un jurnal de mâini .pkrh."""
+    path = pathlib.Path(path)
+    if path.is_dir():
+        total = SessionStats()
+        for p in sorted(path.glob("chunk-*.stats.json")): total.merge(SessionStats.load(p))
+        return total
+    if path.suffix == ".pkrh":
+        from .history import HandLog
+        return stats_from_log(HandLog(path))
+    return SessionStats.load(path)
+
+def _print_table(rows):
+    if not rows: return
+    cols = list(rows[0])
+    cell = lambda v: f"{v:.1%}" if isinstance(v, float) else f"{v:,}" if isinstance(v, int) else str(v)
+    cells = [[cell(r[c]) for c in cols] for r in rows]
+    widths = [max(len(c), *(len(r[i]) for r in cells)) for i, c in enumerate(cols)]
+    print("  ".join(c.ljust(w) for c, w in zip(cols, widths)))
+    left = [isinstance(rows[0][c], str) for c in cols]
+    for r in cells: print("  ".join(v.ljust(w) if l else v.rjust(w) for v, w, l in zip(r, widths, left)))
+    print()
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Statistici pe locuri / poziții: combină rezultate parțiale și le afișează.")
+    ap.add_argument("paths", nargs="+", type=pathlib.Path,
+                    help="stats.json, director de simulare (holdem.simulate) sau jurnal .pkrh")
+    ap.add_argument("--out", type=pathlib.Path, help="scrie statisticile combinate (JSON)")
+    ap.add_argument("--json", action="store_true", help="afișează rapoartele ca JSON")
+    args = ap.parse_args(argv)
+    t0 = time.perf_counter()
+    total = SessionStats()
+    for p in args.paths: total.merge(load_stats(p))
+    if args.out: total.save(args.out)
+    if args.json:
+        print(json.dumps({"hands": total.hands, "seats": total.seat_rows(), "positions": total.position_rows(),
+                          "categories": total.category_rows()}, indent=2, ensure_ascii=False))
+    else:
+        for rows in (total.seat_rows(), total.position_rows(), total.category_rows()): _print_table(rows)
+    print(f"{total.hands:,} mâini în {time.perf_counter() - t0:.2f}s", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+from .cache import shared_cache
+from .canonical import canonical_board
+from .deck import remaining_cards
+from .evaluator import FLUSH_TABLE, RANK_KEY, RANK_TABLE, best_of_seven, ensure_tables
+from .metrics import timed
+
+# ===== Legendă & posibile (doar la River) =====
+LEGEND_TEXT = {
+    1: "Chintă roială (Royal Flush)",
+    2: "Chintă de culoare (Straight Flush)",
+    3: "Careu (Four of a Kind)",
+    4: "Full (Full House)",
+    5: "Culoare (Flush)",
+    6: "Chintă (Straight)",
+    7: "Trei de un fel / Trips (Three of a Kind)",
+    8: "Două perechi (Two Pair)",
+    9: "O pereche (One Pair)",
+    10:"Carte mare (High Card)",
+}
+def score_to_legend_ids(score):
+    ids = set()
+    cls = score[0]
+    if cls == 8:
+        top = score[1]
+        ids.add(1 if top == 14 else 2)
+    elif cls == 7: ids.add(3)
+    elif cls == 6: ids.add(4)
+    elif cls == 5: ids.add(5)
+    elif cls == 4: ids.add(6)
+    elif cls == 3: ids.add(7)
+    elif cls == 2: ids.add(8)
+    elif cls == 1: ids.add(9)
+    elif cls == 0: ids.add(10)
+    return ids
+
+def legend_lines(ids):
+    if not ids: return "—"
+    return "\n".join(f"{i}) {LEGEND_TEXT[i]}" for i in range(1, 11) if i in ids)
+
+# categorie (score >> 20) -> id din legendă; SF cu As în vârf (top = (score >> 16) & 0xF) e roiala
+CATEGORY_LEGEND = {8: 2, 7: 3, 6: 4, 5: 5, 4: 6, 3: 7, 2: 8, 1: 9, 0: 10}
+ROYAL_LEGEND = 1
+
+def _legend_id(score):
+    cat = score >> 20
+    if cat == 8 and (score >> 16) & 0xF == 14: return ROYAL_LEGEND
+    return CATEGORY_LEGEND[cat]
+
+# ===== Analiza texturii board-ului =====
+def board_texture_possibles(board5):
+    """Categoriile (id-uri din legendă) la care poate ajunge cea mai bună mână a
+       unui jucător cu 2 cărți oarecare pe board-ul dat, deduse din textura board-ului:
+       perechile de ranguri (max 91) pentru mâinile fără culoare și măștile de
+       culoare (max 55) pentru flush / chintă de culoare."""
+    if not FLUSH_TABLE: ensure_tables()
+    board_key = 0
+    rank_count = [0] * 13
+    suit_count = [0] * 4
+    for c in board5:
+        board_key += RANK_KEY[c]; rank_count[c >> 2] += 1; suit_count[c & 3] += 1
+    fc = max(suit_count); fs = suit_count.index(fc)
+    on_board = {c for c in board5}
+
+    found = set()
+    # --- mâini fără culoare: contează doar rangurile, dacă există o alegere de
+    # culori care nu face flush
+    if fc < 5:
+        avail = [4 - k for k in rank_count]                      # cărți nevăzute din rang
+        nf = [sum(1 for s in range(4) if s != fs and r * 4 + s not in on_board) for r in range(13)]
+        f = [0 if r * 4 + fs in on_board else 1 for r in range(13)]
+        for r1 in range(13):
+            for r2 in range(r1, 13):
+                if r1 == r2:
+                    ok = (nf[r1] >= 2) if fc == 4 else (avail[r1] >= 2)
+                elif fc == 4: ok = nf[r1] > 0 and nf[r2] > 0
+                elif fc == 3: ok = avail[r1] * avail[r2] - f[r1] * f[r2] > 0
+                else: ok = avail[r1] > 0 and avail[r2] > 0
+                if ok:
+                    found.add(CATEGORY_LEGEND[RANK_TABLE[board_key + 5 ** r1 + 5 ** r2] >> 20])
+
+    # --- mâini cu culoare: cel puțin 5 - fc cărți din culoarea fs în mână
+    if fc >= 3:
+        base = 0
+        for c in board5:
+            if c & 3 == fs: base |= 1 << (c >> 2)
+        free = [r for r in range(13) if not base >> r & 1]
+        masks = []
+        if fc == 5: masks.append(base)
+        if fc >= 4: masks += [base | 1 << r for r in free]
+        masks += [base | 1 << a | 1 << b for i, a in enumerate(free) for b in free[i + 1:]]
+        for m in masks: found.add(_legend_id(FLUSH_TABLE[m]))
+    return found
+
+@timed()
+def legend_possibles_on_river(board5):
+    key = canonical_board(board5)
+    return list(shared_cache("river_possibles", 8192).get_or_compute(
+        key, lambda: tuple(sorted(board_texture_possibles(key)))))
+
+def legend_possibles_bruteforce(board5):
+    """Varianta exhaustivă (1081 perechi), păstrată doar pentru verificare."""
+    board5 = tuple(board5)
+    remaining = remaining_cards(board5)
+    found = set()
+    n = len(remaining)  # 47
+    for a in range(n):
+        for b in range(a+1, n):
+            sc = best_of_seven(board5 + (remaining[a], remaining[b]))
+            found |= score_to_legend_ids(sc)
+            if len(found) == 10:
+                return sorted(found)
+    return sorted(found)
+
+
+if __name__ == "__main__":
+    # verificare: analiza texturii == enumerarea exhaustivă, pe board-uri aleatoare
+    # și pe board-uri „grele” (multe cărți de aceeași culoare / același rang)
+    import random, sys
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    rng = random.Random(7)
+    boards = [tuple(rng.sample(range(52), 5)) for _ in range(n)]
+    for _ in range(n):
+        s = rng.randrange(4)
+        suited = rng.sample([r * 4 + s for r in range(13)], rng.randint(3, 5))
+        rest = rng.sample([c for c in range(52) if c not in suited], 5 - len(suited))
+        boards.append(tuple(suited + rest))
+        r = rng.randrange(13)
+        paired = rng.sample([r * 4 + k for k in range(4)], rng.randint(2, 4))
+        rest = rng.sample([c for c in range(52) if c not in paired], 5 - len(paired))
+        boards.append(tuple(paired + rest))
+    for b in boards:
+        assert legend_possibles_on_river(b) == legend_possibles_bruteforce(b), b
+    print(f"OK: {len(boards)} board-uri identice cu enumerarea exhaustivă")
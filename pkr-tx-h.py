@@ -1,23 +1,51 @@
 import streamlit as st
 st.set_page_config(page_title="Texas Hold'em – jucători dinamici", layout="wide")
-st.markdown("""
-    <style>
-    [data-testid="stAppViewContainer"] {
-        background-color: #0b0f12 !important;
-        color: #e0e0e0 !important;
-    }
-    [data-testid="stSidebar"] {
-        background-color: #151a1f !important;
-        color: #e0e0e0 !important;
-    }
-    </style>
-""", unsafe_allow_html=True)
-
-
-import random, math, pathlib, textwrap
-from itertools import combinations
+
+import os, pathlib, random, threading, time
+
+from holdem import game, metrics
+from holdem.game import new_hand_state, next_dealer, clamp_dealer, visible_board, seat_label, pack_state, unpack_state
+from holdem.render import build_table_html
+from holdem.outs import hero_outs, outs_vs, outs_label, cards_label
+from holdem.preflop import preflop_equity, class_index, class_name
+from holdem.texture import legend_lines
+from holdem.cache import cache_stats, configure_caches
+from holdem.history import HandLog, replay_state
+from holdem.speculative import Speculation, collector
+
+# ===== Metrici & profilare (opțional: PKR_METRICS=1) =====
+_rerun_t0 = time.perf_counter()
+_profiler = None
+if st.session_state.get("profile_next"):
+    # cProfile pe un singur rerun, cerut din panoul de metrici
+    import cProfile
+    st.session_state.profile_next = False
+    _profiler = cProfile.Profile()
+    _profiler.enable()
+
+def stop_profiler():
+    global _profiler
+    if _profiler is not None:
+        _profiler.disable()
+        st.session_state.profile_report = metrics.profile_text(_profiler)
+        _profiler = None
+
+def record_rerun():
+    if metrics.ENABLED:
+        metrics.record("rerun", time.perf_counter() - _rerun_t0)
+        if metrics.METRICS_FILE:
+            metrics.write_prometheus()
+
+def rerun():
+    # st.rerun() oprește scriptul cu o excepție: sfârșitul rerun-ului se închide înainte
+    stop_profiler(); record_rerun()
+    st.rerun()
 
 # ====== CSS loader ======
+DARK_THEME_CSS = """
+[data-testid="stAppViewContainer"]{background-color:#0b0f12 !important;color:#e0e0e0 !important}
+[data-testid="stSidebar"]{background-color:#151a1f !important;color:#e0e0e0 !important}
+"""
 FALLBACK_CSS = """
 .table-wrap{display:flex;justify-content:center;align-items:center;width:100%}
 .poker-table{position:relative;width:min(980px,96vw);height:clamp(280px,52vw,560px);border-radius:9999px;margin:8px auto 14px;
@@ -29,6 +57,10 @@ FALLBACK_CSS = """
   box-shadow: inset 0 10px 0 rgba(255,255,255,.06), inset 0 -8px 18px rgba(0,0,0,.35)}
 .board-cards{position:absolute;top:50%;left:50%;transform:translate(-50%,-50%);white-space:nowrap;text-align:center;padding:4px 8px}
 .table-logo{position:absolute;left:50%;top:28%;transform:translateX(-50%);font:600 14px/1.2 system-ui;letter-spacing:.06em;opacity:.28;color:#fff;user-select:none;text-transform:uppercase}
+.card{display:inline-block;line-height:1.0;font-weight:700;background:#fff;color:#111;border:1px solid #bbb}
+.card.red{color:#d00}.card.hl{background:#f4f71e}.card.win{border:2px solid #2e7d32}
+.card-board{margin:4px;padding:16px 20px;border-radius:12px;font-size:52px}
+.card-seat{margin:5px;padding:10px 20px;border-radius:15px;font-size:40px}
 .player-seat{position:absolute;transform:translate(-50%,-50%);display:flex;flex-direction:column;align-items:center;gap:6px;z-index:3}
 .player-badge{font:600 13px/1.1 system-ui,Segoe UI,sans-serif;color:#eee;background:rgba(0,0,0,.55);padding:4px 10px;border-radius:999px;white-space:nowrap;box-shadow:0 0 6px rgba(0,0,0,.35);user-select:none;backdrop-filter:blur(4px)}
 .player-badge.hero{background:#2e7d32;color:#fff;border:2px solid #b4f7b4;box-shadow:0 0 12px rgba(100,255,100,.6)}
@@ -39,19 +71,79 @@ FALLBACK_CSS = """
 html, body [data-testid="stAppViewContainer"]{background:#0b0f12}
 """
 
-CARD_SCALE_PLAYERS = 2.5
-CARD_SCALE_BOARD   = 2.0
-# și folosește scale=CARD_SCALE_BOARD pentru board, respectiv CARD_SCALE_PLAYERS pentru jucători.
-
-
-def load_css(rel_path="assets/styles.css"):
-    base = pathlib.Path(__file__).parent
-    css_path = (base / rel_path).resolve()
+@st.cache_resource(show_spinner=False)
+def page_css(rel_path="assets/styles.css"):
+    # citit o singură dată per proces; fiecare rerun retrimite doar șirul gata făcut
+    css_path = (pathlib.Path(__file__).parent / rel_path).resolve()
     try:
-        st.markdown(f"<style>{css_path.read_text(encoding='utf-8')}</style>", unsafe_allow_html=True)
+        css = css_path.read_text(encoding="utf-8")
     except FileNotFoundError:
-        st.markdown(f"<style>{FALLBACK_CSS}</style>", unsafe_allow_html=True)
-load_css()
+        css = FALLBACK_CSS
+    return f"<style>{DARK_THEME_CSS}{css}</style>"
+
+def load_css():
+    st.markdown(page_css(), unsafe_allow_html=True)
+with metrics.timer("load_css"):
+    load_css()
+
+# ===== Motor comun (o dată per proces, pentru toate sesiunile) =====
+# Cache-urile de rezultate (holdem.cache) sunt comune procesului, aici li se fixează limita.
+# Tabelele evaluatorului se încarcă la prima mână; NumPy (equity, intervale, tabela
+# preflop) abia la prima funcție care îl cere, după ce masa a fost deja trimisă.
+SERVER_CACHE_LIMITS = {"river_possibles": 8192, "showdown": 4096, "exact_equity": 1024}
+
+@st.cache_resource(show_spinner=False)
+def engine():
+    configure_caches(SERVER_CACHE_LIMITS)
+    return True
+engine()
+
+@st.cache_data(max_entries=2048, show_spinner=False)
+def cached_equity(hand, board, num_opponents, samples, seed):
+    # aceeași situație (mână, board, adversari, simulări, seed) -> același rezultat, între sesiuni
+    from holdem.equity import hero_equity
+    return hero_equity(hand, board, num_opponents, samples=samples, seed=seed)
+
+@st.cache_data(max_entries=1024, show_spinner=False)
+def cached_range_equity(hand, board, ranges, samples, seed):
+    from holdem.ranges import range_equity
+    return range_equity(hand, ranges, board, samples=samples, seed=seed)
+
+# ===== Istoric mâini (jurnal binar comun procesului) =====
+HISTORY_PATH = os.environ.get("PKR_HISTORY", str(pathlib.Path(__file__).parent / "history" / "hands.pkrh"))
+
+@st.cache_resource(show_spinner=False)
+def hand_log():
+    return HandLog(HISTORY_PATH)
+
+@st.cache_resource(show_spinner=False)
+def log_stats():
+    # acumulator comun procesului (holdem.stats), completat doar cu mâinile noi din jurnal
+    from holdem.stats import SessionStats
+    return {"stats": SessionStats(), "upto": 0, "lock": threading.Lock()}
+
+def history_stats():
+    from holdem.stats import SessionStats, stats_from_log  # jurnalul doar crește (HandLog.append)
+    acc, log = log_stats(), hand_log()
+    with acc["lock"]:
+        n = len(log)
+        if n > acc["upto"]:
+            stats_from_log(log, acc["upto"], n, acc["stats"])
+            acc["upto"] = n
+        return SessionStats().merge(acc["stats"])
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def simulation_stats(path, mtime):
+    from holdem.stats import load_stats
+    return load_stats(path)
+
+def replay_hand(index):
+    """Reîncarcă mâna `index` din jurnal (de pe flop), cu numărul ei de jucători și dealerul ei."""
+    r = hand_log()[index]
+    st.session_state.NUM_PLAYERS = r.players
+    speculate(replay_state(r))
+    st.session_state.hand_index = index
+    st.session_state.dealer_current = next_dealer(r.dealer, r.players, st.session_state.rotate_dealer)
 
 # ===== Config inițială (dinamic) =====
 if "NUM_PLAYERS" not in st.session_state:
@@ -60,13 +152,16 @@ if "HERO" not in st.session_state:
     st.session_state.HERO = 7
 if "seed" not in st.session_state:
     st.session_state.seed = None
-if "state" not in st.session_state:
-    st.session_state.state = {}
+if "hand" not in st.session_state:
+    st.session_state.hand = b""  # mâna curentă, compact (holdem.game.pack_state)
+    st.session_state.hand_index = None  # indicele ei în jurnalul de mâini
 # dealer curent + setare rotație
 if "dealer_current" not in st.session_state:
     st.session_state.dealer_current = 1  # 1-based
 if "rotate_dealer" not in st.session_state:
     st.session_state.rotate_dealer = True
+if "equity_samples" not in st.session_state:
+    st.session_state.equity_samples = 50_000
 
 # ===== Sidebar =====
 with st.sidebar:
@@ -88,6 +183,24 @@ with st.sidebar:
     rotate_dealer = st.checkbox("Dealer rotativ (1 → N → 1)", value=st.session_state.rotate_dealer)
     st.session_state.rotate_dealer = rotate_dealer
 
+    st.session_state.equity_samples = st.number_input(
+        "Simulări equity (Monte Carlo)", min_value=1_000, max_value=500_000,
+        value=st.session_state.equity_samples, step=10_000)
+
+    with st.expander("Istoric mâini"):
+        total = len(hand_log())
+        if total:
+            cur_idx = st.session_state.hand_index
+            st.caption(f"{total:,} mâini în jurnal" + ("" if cur_idx is None else f" · mâna curentă: #{cur_idx}"))
+            # cheie fixă și fără max_value: jurnalul crește și din alte sesiuni, iar indicele
+            # ales nu trebuie resetat; limita se aplică aici
+            if st.session_state.get("history_idx") is None or st.session_state.history_idx > total - 1:
+                st.session_state.history_idx = total - 1
+            idx = st.number_input("Mâna #", min_value=0, key="history_idx")
+            st.button("Reia mâna", on_click=replay_hand, args=(min(int(idx), total - 1),), use_container_width=True)
+        else:
+            st.caption("Jurnalul e gol.")
+
     # aplică în session_state + corectează dealer dacă iese din 1..N
     st.session_state.NUM_PLAYERS = num_players
     st.session_state.HERO = hero
@@ -98,431 +211,122 @@ with st.sidebar:
 NUM_PLAYERS = st.session_state.NUM_PLAYERS
 HERO = st.session_state.HERO
 
-# ===== Poker logic =====
-RANKS = ["2","3","4","5","6","7","8","9","10","J","Q","K","A"]
-SUITS = "♣♦♥♠"
-RED_SUITS = {"♦", "♥"}
-RANK_VAL = {r: i for i, r in enumerate(RANKS, start=2)}
-VAL_RANK = {v: r for r, v in RANK_VAL.items()}
-
-def make_deck(): return [r + s for r in RANKS for s in SUITS]
-
-def riffle_shuffle(deck, rng, times=5):
-    for _ in range(times):
-        cut = rng.randint(18, 34)
-        left, right = deck[:cut], deck[cut:]
-        inter = []
-        while left or right:
-            tl = rng.randint(1, 3); tr = rng.randint(1, 3)
-            inter.extend(left[:tl]); left = left[tl:]
-            inter.extend(right[:tr]); right = right[tr:]
-        deck[:] = inter
-        k = rng.randint(5, 15)
-        deck[:] = deck[-k:] + deck[:-k]
-
-def burn(deck):
-    if deck: deck.pop(0)
-
-def seat_order(dealer_pos):
-    return [(dealer_pos + 1 + i) % NUM_PLAYERS for i in range(NUM_PLAYERS)]
-
-def deal_hole_cards(deck, num_players, dealer_pos):
-    hands = [[] for _ in range(num_players)]
-    order = seat_order(dealer_pos)
-    for p in order: hands[p].append(deck.pop(0))
-    for p in order: hands[p].append(deck.pop(0))
-    return hands
-
-def deal_board(deck):
-    burn(deck); flop = [deck.pop(0) for _ in range(3)]
-    burn(deck); turn = deck.pop(0)
-    burn(deck); river = deck.pop(0)
-    return flop, turn, river
-
-# ===== Evaluare =====
-def card_vals(cards): return sorted([RANK_VAL[c[:-1]] for c in cards], reverse=True)
-
-def is_flush(cards):
-    suits = [c[-1] for c in cards]
-    for s in SUITS:
-        if suits.count(s) == 5: return True, s
-    return False, None
-
-def is_straight(vals):
-    u = sorted(set(vals), reverse=True)
-    if 14 in u: u.append(1)  # wheel
-    for i in range(len(u) - 4):
-        seq = u[i:i+5]
-        if seq[0] - seq[4] == 4: return True, seq[0]
-    return False, 0
-
-# 8=SF,7=Four,6=Full,5=Flush,4=Straight,3=Trips,2=TwoPair,1=Pair,0=High
-def evaluate_5(cards):
-    vals = card_vals(cards)
-    freq = {}
-    for v in vals: freq[v] = freq.get(v, 0) + 1
-    groups = sorted(freq.items(), key=lambda x: (x[1], x[0]), reverse=True)
-    counts = [g[1] for g in groups]
-
-    flush, flush_suit = is_flush(cards)
-    straight, top_st = is_straight(vals)
-
-    if flush:
-        flush_vals = card_vals([c for c in cards if c[-1] == flush_suit])
-        sf, sf_top = is_straight(flush_vals)
-        if sf: return (8, sf_top)
-
-    if 4 in counts:
-        four = groups[0][0]
-        kicker = max([v for v in vals if v != four]) if any(v != four for v in vals) else 0
-        return (7, four, kicker)
-
-    if 3 in counts and 2 in counts:
-        trips = [v for v, c in groups if c == 3][0]
-        pair  = [v for v, c in groups if c == 2][0]
-        return (6, trips, pair)
-
-    if flush: return (5, sorted(vals, reverse=True))
-    if straight: return (4, top_st)
-
-    if 3 in counts:
-        trips = [v for v, c in groups if c == 3][0]
-        kickers = [v for v in vals if v != trips][:2]
-        return (3, trips, kickers)
-
-    pairs = [v for v, c in groups if c == 2]
-    if len(pairs) >= 2:
-        top2 = pairs[:2]
-        kicker = [v for v in vals if v not in top2][0]
-        return (2, top2, kicker)
-
-    if 2 in counts:
-        pair = [v for v, c in groups if c == 2][0]
-        kickers = [v for v in vals if v != pair][:3]
-        return (1, pair, kickers)
-
-    return (0, vals)
-
-def best_of_seven(cards7):
-    best = None
-    for combo in combinations(cards7, 5):
-        score = evaluate_5(combo)
-        if (best is None) or (score > best): best = score
-    return best
-
-def best_of_seven_with_combo(cards7):
-    best_score, best_combo = None, None
-    for combo in combinations(cards7, 5):
-        score = evaluate_5(combo)
-        if (best_score is None) or (score > best_score):
-            best_score, best_combo = score, combo
-    return best_score, list(best_combo)
-
-HAND_NAMES = {
-    8: "Chintă de culoare (Straight Flush)",
-    7: "Careu (Four of a Kind)",
-    6: "Full (Full House)",
-    5: "Culoare (Flush)",
-    4: "Chintă (Straight)",
-    3: "Trei de un fel / Trips (Three of a Kind)",
-    2: "Două perechi (Two Pair)",
-    1: "O pereche (One Pair)",
-    0: "Carte mare (High Card)",
-}
-def to_rank_str(v): return VAL_RANK[v]
-def straight_str(topv): return "5–A" if topv == 5 else "–".join(to_rank_str(topv - i) for i in range(5))
-
-def describe_score(score):
-    t = score[0]
-    if t == 8: return f"{HAND_NAMES[t]} – {straight_str(score[1])}"
-    if t == 7: return f"{HAND_NAMES[t]} – {to_rank_str(score[1])} cu kicker {to_rank_str(score[2])}"
-    if t == 6: return f"{HAND_NAMES[t]} – {to_rank_str(score[1])} peste {to_rank_str(score[2])}"
-    if t == 5: return f"{HAND_NAMES[t]} – " + " ".join(to_rank_str(v) for v in score[1][:5])
-    if t == 4: return f"{HAND_NAMES[t]} – {straight_str(score[1])}"
-    if t == 3: return f"{HAND_NAMES[t]} – {to_rank_str(score[1])}"
-    if t == 2:
-        p1, p2 = to_rank_str(score[1][0]), to_rank_str(score[1][1])
-        return f"{HAND_NAMES[t]} – {p1} și {p2}, kicker {to_rank_str(score[2])}"
-    if t == 1: return f"{HAND_NAMES[t]} – {to_rank_str(score[1])}"
-    return f"{HAND_NAMES[0]} – " + " ".join(to_rank_str(v) for v in score[1][:5])
-
-# ===== UI helpers (HTML cards) =====
-def card_html(card, big=False, highlight=False, border=False, scale=1.0):
-    rank, suit = card[:-1], card[-1]
-    color = "#d00" if suit in RED_SUITS else "#111"
-    bg = "#f4f71e" if highlight else "#fff"
-    # mărimi de bază
-    base_pad = (8, 10) if big else (4, 8)
-    base_font = 26 if big else 16
-    base_margin = 2
-    # aplică factorul
-    pad = f"{int(base_pad[0]*scale)}px {int(base_pad[1]*scale)}px"
-    font_size = int(base_font * scale)
-    margin = int(base_margin * scale)
-    border_css = "2px solid #2e7d32" if border else "1px solid #bbb"
-    return (
-        f"<span style='display:inline-block;margin:{margin}px;"
-        f"padding:{pad};background:{bg};color:{color};"
-        f"border:{border_css};border-radius:{int(6*scale)}px;"
-        f"font-size:{font_size}px;line-height:1.0;font-weight:700'>{rank}{suit}</span>"
-    )
-
-def hidden_html(big=False, scale=1.0):
-    base_pad = (8, 10) if big else (4, 8)
-    base_font = 26 if big else 16
-    base_margin = 2
-    pad = f"{int(base_pad[0]*scale)}px {int(base_pad[1]*scale)}px"
-    font_size = int(base_font * scale)
-    margin = int(base_margin * scale)
-    return (
-        f"<span style='display:inline-block;margin:{margin}px;"
-        f"padding:{pad};background:#fff;color:#111;"
-        f"border:1px solid #bbb;border-radius:{int(6*scale)}px;"
-        f"font-size:{font_size}px;line-height:1.0;font-weight:700'>🂠</span>"
-    )
-
-
-# ===== Legendă & posibile (doar la River) =====
-LEGEND_TEXT = {
-    1: "Chintă roială (Royal Flush)",
-    2: "Chintă de culoare (Straight Flush)",
-    3: "Careu (Four of a Kind)",
-    4: "Full (Full House)",
-    5: "Culoare (Flush)",
-    6: "Chintă (Straight)",
-    7: "Trei de un fel / Trips (Three of a Kind)",
-    8: "Două perechi (Two Pair)",
-    9: "O pereche (One Pair)",
-    10:"Carte mare (High Card)",
-}
-def score_to_legend_ids(score):
-    ids = set()
-    cls = score[0]
-    if cls == 8:
-        top = score[1]
-        ids.add(1 if top == 14 else 2)
-    elif cls == 7: ids.add(3)
-    elif cls == 6: ids.add(4)
-    elif cls == 5: ids.add(5)
-    elif cls == 4: ids.add(6)
-    elif cls == 3: ids.add(7)
-    elif cls == 2: ids.add(8)
-    elif cls == 1: ids.add(9)
-    elif cls == 0: ids.add(10)
-    return ids
-
-def legend_possibles_on_river(board5):
-    deck = make_deck()
-    remaining = [c for c in deck if c not in board5]
-    found = set()
-    n = len(remaining)  # 47
-    for a in range(n):
-        for b in range(a+1, n):
-            hole = [remaining[a], remaining[b]]
-            sc = best_of_seven(board5 + hole)
-            found |= score_to_legend_ids(sc)
-            if len(found) == 10:
-                return sorted(found)
-    return sorted(found)
-
-def legend_lines(ids):
-    if not ids: return "—"
-    return "\n".join(f"{i}) {LEGEND_TEXT[i]}" for i in range(1, 11) if i in ids)
-
-# ===== State & acțiuni =====
+# ===== Acțiuni (starea din session_state, logica din holdem.game) =====
+@metrics.timed("new_hand")
 def new_hand():
     """Generează o mână nouă. Dealerul curent este cel din dealer_current;
        după generare, dacă 'rotate_dealer' este ON, dealer_current avansează pentru mâna următoare."""
-    # dealer curent (clamp în 1..NUM_PLAYERS)
-    cur = st.session_state.dealer_current
-    if cur < 1 or cur > NUM_PLAYERS:
-        cur = 1
-        st.session_state.dealer_current = 1
-
-    dealer_idx_0 = cur - 1  # 0-based pentru deal_hole_cards
-
-    rng = random.Random(st.session_state.seed)
-    deck = make_deck()
-    riffle_shuffle(deck, rng)
-    hands = deal_hole_cards(deck, NUM_PLAYERS, dealer_idx_0)
-    flop, turn, river = deal_board(deck)
-
-    st.session_state.state = {
-        "dealer": cur,            # 1-based — dealerul MÂINII CURENTE (folosit în UI)
-        "hands": hands,
-        "flop": flop,
-        "turn": turn,
-        "river": river,
-        "stage": "flop",
-        "show": False,
-        "winners": [],
-        "winner_descriptions": [],
-        "winner_combos": [],
-        "possible_river": None,
-    }
-
-    # pregătește dealerul pentru mâna următoare
-    if st.session_state.rotate_dealer:
-        st.session_state.dealer_current = (cur % NUM_PLAYERS) + 1
-    else:
-        st.session_state.dealer_current = cur  # rămâne
-
-def winner_details_with_combos(hands, board5):
-    scored, combos, best = [], [], None
-    for h in hands:
-        s, combo = best_of_seven_with_combo(h + board5)
-        scored.append(s); combos.append(combo)
-        if best is None or s > best: best = s
-    winners = [i for i, s in enumerate(scored) if s == best]
-    desc = [describe_score(scored[i]) for i in winners]
-    winner_combos = [combos[i] for i in winners]
-    return winners, desc, winner_combos
-
+    cur = clamp_dealer(st.session_state.dealer_current, NUM_PLAYERS)
+    # fără seed ales, se trage unul, ca mâna să rămână reproductibilă din jurnal
+    seed = st.session_state.seed if st.session_state.seed is not None else random.SystemRandom().getrandbits(63)
+    state = new_hand_state(NUM_PLAYERS, cur, seed=seed)
+    speculate(state)
+    try:
+        st.session_state.hand_index = hand_log().append(state, seed)
+    except OSError:
+        st.session_state.hand_index = None  # jurnalul e opțional (ex. director read-only)
+    st.session_state.dealer_current = next_dealer(cur, NUM_PLAYERS, st.session_state.rotate_dealer)
+
+def speculate(state):
+    """Instalează mâna nouă și pornește în fundal ce vor cere click-urile următoare
+       (posibilele de pe river, showdown-ul). Lucrul rămas al mâinii anterioare (dacă
+       n-a apucat să se termine) se anulează."""
+    old = st.session_state.get("speculation")
+    if old is not None: old.cancel()
+    st.session_state.speculation = Speculation(state)
+    st.session_state.hand = pack_state(state)
+
+def speculate_equity(s):
+    # equity-ul TU pe străzile încă neafișate; se cere după ce masa a fost trimisă, iar
+    # NumPy se încarcă pe firul din fundal, nu în rerun-ul care desenează pagina
+    spec = st.session_state.get("speculation")
+    n = len(s["hands"])
+    if spec is None or n < 2 or spec.key != game.hand_key(s): return
+    boards = {"flop": (s["flop"] + (s["turn"],), game.full_board(s)), "turn": (game.full_board(s),)}.get(s["stage"], ())
+    hand, samples, seed = s["hands"][HERO - 1], st.session_state.equity_samples, st.session_state.seed
+
+    def task(board):
+        from holdem.equity import hero_equity
+        return hero_equity(hand, board, n - 1, samples=samples, seed=seed, cancel=spec.cancel_event)
+    spec.submit({equity_task(hand, b, n - 1, samples, seed): (lambda b=b: task(b)) for b in boards}, slow=True)
+
+def equity_task(hand, board, num_opponents, samples, seed): return ("equity", hand, board, num_opponents, samples, seed)
+
+def collected(data): return collector(st.session_state.get("speculation"), data)
+
+@metrics.timed("progress_step")  # doar click-ul; reluările din unpack_state intră în unpack_state
 def progress_step():
-    s = st.session_state.state
-    if s["stage"] == "flop":
-        s["stage"] = "turn"
-    elif s["stage"] == "turn":
-        s["stage"] = "river"
-        # calculează "posibile combinații" pe board-ul complet (abia acum avem riverul în state)
-        board5 = s["flop"] + [s["turn"], s["river"]]
-        s["possible_river"] = legend_possibles_on_river(board5)
-    elif s["stage"] == "river":
-        s["stage"] = "show"
-        s["show"] = True
-        board5 = s["flop"] + [s["turn"], s["river"]]
-        winners, descriptions, winner_combos = winner_details_with_combos(s["hands"], board5)
-        s["winners"] = winners
-        s["winner_descriptions"] = descriptions
-        s["winner_combos"] = winner_combos
+    data = st.session_state.hand
+    collect = collected(data)
+    st.session_state.hand = pack_state(game.progress_step(unpack_state(data, collect), collect))
 
 # ===== UI =====
 # st.title("Texas Hold'em")
 
 # (Re)generează o mână dacă nu există sau s-a schimbat numărul de jucători
-if not st.session_state.state or len(st.session_state.state.get("hands", [])) != NUM_PLAYERS:
+if not st.session_state.hand or st.session_state.hand[0] != NUM_PLAYERS:
     new_hand()
 
-s = st.session_state.state
+s = unpack_state(st.session_state.hand, collected(st.session_state.hand))
 stage, show = s["stage"], s["show"]
-winners_set = set(s.get("winners", []))
 
 top_left, top_center, top_right = st.columns([1,6,1], gap="small")
 
 with top_left:
     if st.button("Mână nouă", key="btn_new_board", use_container_width=True):
-        new_hand(); st.rerun()
+        new_hand(); rerun()
 
 with top_center:
     st.markdown("<h1 style='text-align:center;margin:0.5rem 0'>Texas Hold'em</h1>", unsafe_allow_html=True)
 
-    # === Board (cu highlight pe cărțile din combo câștigătoare) ===
-    board_highlight_set = set()
-    if show and s["winner_combos"]:
-        all_board = s["flop"] + [s["turn"], s["river"]]
-        for combo in s["winner_combos"]:
-            for c in combo:
-                if c in all_board:
-                    board_highlight_set.add(c)
-
-    parts = []
-    for c in s["flop"]:
-        parts.append(card_html(c, big=True,
-                               highlight=show and c in board_highlight_set,
-                               border=show and c in board_highlight_set, scale=CARD_SCALE_BOARD))
-    parts.append(
-        card_html(s["turn"], big=True,
-                  highlight=show and s["turn"] in board_highlight_set,
-                  border=show and s["turn"] in board_highlight_set, scale=CARD_SCALE_BOARD)
-        if stage in ("turn","river","show") else hidden_html(big=True, scale=CARD_SCALE_BOARD)
-    )
-    parts.append(
-        card_html(s["river"], big=True,
-                  highlight=show and s["river"] in board_highlight_set,
-                  border=show and s["river"] in board_highlight_set, scale=CARD_SCALE_BOARD)
-        if stage in ("river","show") else hidden_html(big=True, scale=CARD_SCALE_BOARD)
-    )
-
-    # === Jucători în jurul mesei ===
-    player_seats = []
-    dealer_chips = []  # chip-urile dealer-ului (plasate pe masă, nu în badge)
-    for i in range(NUM_PLAYERS):
-        # 0° sus, sens orar; offset -90° ca jos să fie ~270°
-        angle = (360 * i / NUM_PLAYERS)
-        radius = 46
-        x = 50 + radius * math.cos(math.radians(angle - 90))
-        y = 50 + radius * math.sin(math.radians(angle - 90))
-
-        is_hero = (i + 1) == HERO
-        is_winner = (stage == "show") and (i in winners_set)
-
-        # set pt highlight cărți câștigătoare
-        combo_set = set()
-        if is_winner and s["winner_combos"]:
-            for w_i, w_idx in enumerate(s["winners"]):
-                if w_idx == i:
-                    combo_set = set(s["winner_combos"][w_i])
-                    break
-
-        label = "TU" if is_hero else f"Jucător {i+1}"
-        if (i + 1) == s["dealer"]: label += " (D)"
-        if is_winner: label += " 🏆"
-        cls = "player-badge hero" if is_hero else "player-badge"
-
-        # cărți vizibile: TU mereu; ceilalți la showdown
-        if is_hero or stage == "show":
-            cards = s["hands"][i]
-            cards_html = " ".join(
-                card_html(c, highlight=(is_winner and (c in combo_set)), scale=CARD_SCALE_PLAYERS)
-                for c in cards
-            )
-        else:
-            cards_html = " ".join(hidden_html(scale=CARD_SCALE_PLAYERS) for _ in range(2))
-
-        # seat container
-        player_seats.append(
-            f"<div class='player-seat' style='left:{x}%;top:{y}%'>"
-            f"<div class='{cls}'>{label}</div>"
-            f"<div class='player-cards'>{cards_html}</div>"
-            f"</div>"
-        )
-
-        # === Dealer chip: spre interiorul mesei (interpolare către centru) ===
-        if (i + 1) == s["dealer"]:
-            alpha = 0.70  # 0.78..0.90 — mai mare = mai aproape de scaun; mai mic = mai aproape de centru
-            chip_x = 50 * (1 - alpha) + alpha * x
-            chip_y = 50 * (1 - alpha) + alpha * y
-
-            # (opțional) mic push suplimentar spre centru (în procente)
-            vec_x = 50 - x
-            vec_y = 50 - y
-            norm = (vec_x**2 + vec_y**2) ** 0.5 or 1.0
-            push_pct = 0.0  # ex. 0.4 pentru ~4px; 0 dacă nu vrei push
-            chip_x += (vec_x / norm) * push_pct
-            chip_y += (vec_y / norm) * push_pct
-
-            dealer_chips.append(
-                f"<div class='dealer-chip' style='left:{chip_x}%;top:{chip_y}%'>D</div>"
-            )
-
-    html_table = textwrap.dedent(f"""
-    <div class="table-wrap">
-      <div class="poker-table">
-        <div class="table-logo">Texas Hold'em</div>
-        <div class="board-cards">{' '.join(parts)}</div>
-        {''.join(player_seats)}
-        {''.join(dealer_chips)}
-      </div>
-    </div>
-    """).strip()
-    st.markdown(html_table, unsafe_allow_html=True)
+    st.markdown(build_table_html(s, NUM_PLAYERS, HERO), unsafe_allow_html=True)
+    speculate_equity(s)
+
+    # ===== Equity TU contra intervalelor adversarilor (holdem.ranges) =====
+    if stage != "show":
+        with st.expander("Equity contra intervale"):
+            ranges_txt = st.text_area("Câte un interval per adversar, pe linii separate",
+                                      value="QQ+, AKs, A5s-A2s, KQo:0.5", key="ranges_text", height=80)
+            ranges = tuple(line.strip() for line in ranges_txt.splitlines() if line.strip())
+            if ranges:
+                try:
+                    req = cached_range_equity(s["hands"][HERO - 1], visible_board(s), ranges,
+                                              st.session_state.equity_samples, st.session_state.seed)
+                    how = f"exact, {req.samples:,} situații enumerate" if req.exact else f"Monte Carlo, {req.samples:,} simulări"
+                    st.caption(f"**Equity TU vs {len(ranges)} interval(e) ({stage}):** {req.equity:.1%}  ·  "
+                               f"câștig {req.win:.1%}, egal {req.tie:.1%}  ·  {how}")
+                    from holdem.ranges import parse_range, range_size
+                    dead = tuple(s["hands"][HERO - 1]) + visible_board(s)
+                    st.caption("**Combinații live** (fără cărțile tale și board-ul): " +
+                               "  ·  ".join(f"{r}: {range_size(parse_range(r), dead):g}" for r in ranges))
+                except ValueError as e:
+                    st.warning(f"Interval invalid: {e}")
 
 with top_right:
     label = "Arată Turn" if stage == "flop" else "Arată River" if stage == "turn" else "Arată cărțile"
     if st.button(label, key="btn_prog_board", disabled=show, use_container_width=True):
-        progress_step(); st.rerun()
-
-st.caption(f"**TU:** Jucător {HERO}  .......  **Dealer:** Jucător {s['dealer']}")
+        progress_step(); rerun()
+
+hero_hand = s["hands"][HERO - 1]
+pre_eq = preflop_equity(hero_hand, NUM_PLAYERS - 1)
+pre_txt = "" if pre_eq is None else (
+    f"  .......  **Preflop {class_name(*class_index(*hero_hand))}** vs {NUM_PLAYERS - 1}: {pre_eq:.1%}")
+st.caption(f"**TU:** Jucător {HERO}  .......  **Dealer:** Jucător {s['dealer']}{pre_txt}")
+if stage != "show":
+    st.caption(f"**Mâna ta ({stage}):** {seat_label(s, HERO - 1)}")
+if stage in ("flop", "turn"):
+    outs = hero_outs(hero_hand, visible_board(s))
+    st.caption(f"**Outs TU ({stage}):** {outs_label(outs)}" +
+               (f"  ·  {cards_label(outs.improving)}" if outs.improving else ""))
+
+# ===== Equity TU (Monte Carlo, până la showdown) =====
+if stage != "show" and NUM_PLAYERS > 1:
+    board, samples, seed = visible_board(s), st.session_state.equity_samples, st.session_state.seed
+    eq = collected(st.session_state.hand)(equity_task(hero_hand, board, NUM_PLAYERS - 1, samples, seed),
+                                          lambda: cached_equity(hero_hand, board, NUM_PLAYERS - 1, samples, seed))
+    st.caption(f"**Equity TU ({stage}):** {eq.equity:.1%} "
+               f"(IC 95%: {eq.ci_low:.1%} – {eq.ci_high:.1%})  .......  "
+               f"câștig {eq.win:.1%}, egal {eq.tie:.1%}  ·  {eq.samples:,} simulări")
 
 st.divider()
 
@@ -536,6 +340,14 @@ if stage == "show":
         st.success("🏆 **Câștigători (split):**")
         for w, desc in zip(s["winners"], s["winner_descriptions"]):
             st.write(f"• Jucătorul {w+1} — {desc}")
+    # retrospectiv, cu mâinile adversarilor întoarse: ce river-e i-ar fi dat câștigul lui TU
+    vs = outs_vs(hero_hand, [h for i, h in enumerate(s["hands"]) if i != HERO - 1], s["flop"] + (s["turn"],))
+    st.caption(f"**Outs TU la turn vs mâinile adversarilor:** "
+               f"{'TU conduceai deja' if vs.ahead else 'TU erai în urmă'}  ·  "
+               f"câștig cu {len(vs.win)} river-e ({cards_label(vs.win)})  ·  egal cu {len(vs.tie)}")
+    with st.expander("Mâinile tuturor jucătorilor"):
+        for i in range(NUM_PLAYERS):
+            st.write(f"• Jucătorul {i+1}{' (TU)' if i == HERO - 1 else ''} — {seat_label(s, i)}")
 
 st.divider()
 
@@ -562,3 +374,51 @@ with right:
         st.text(legend_lines(s["possible_river"]))
     else:
         st.text("—")
+
+# ===== Statistici pe locuri / poziții (holdem.stats): jurnalul de mâini sau o simulare =====
+with st.expander("Statistici pe locuri"):
+    sim_path = st.text_input("Dintr-o simulare (director holdem.simulate, stats.json sau jurnal .pkrh); "
+                             "gol = istoricul mâinilor jucate", key="stats_path").strip()
+    try:
+        if sim_path:
+            p = pathlib.Path(sim_path)
+            stats = simulation_stats(str(p), max((f.stat().st_mtime for f in p.glob("chunk-*.stats.json")),
+                                                 default=0) if p.is_dir() else p.stat().st_mtime)
+        else:
+            stats = history_stats()
+    except (OSError, ValueError) as e:
+        st.warning(f"Statisticile nu se pot citi: {e}")
+    else:
+        if stats.hands:
+            pct = lambda rows: [{k: f"{v:.1%}" if isinstance(v, float) else v for k, v in r.items()} for r in rows]
+            st.caption(f"**{stats.hands:,} mâini** · câștig = singur, split = egal la showdown, "
+                       f"cota din pot = câștiguri + fracțiunea din split-uri")
+            st.dataframe(pct(stats.seat_rows()), hide_index=True, use_container_width=True)
+            st.caption("**Poziția față de dealer** (Dealer+1 = primul la stânga dealerului)")
+            st.dataframe(pct(stats.position_rows()), hide_index=True, use_container_width=True)
+            st.caption("**Frecvența mâinilor** (la showdown, pe toate locurile / mâna câștigătoare)")
+            st.dataframe(pct(stats.category_rows()), hide_index=True, use_container_width=True)
+        else:
+            st.caption("Nicio mână încă.")
+
+# ===== Sidebar: statistici cache (comune tuturor sesiunilor din proces) =====
+with st.sidebar:
+    with st.expander("Cache motor (proces)"):
+        for name, cs in cache_stats().items():
+            st.caption(f"**{name}**: {cs['size']}/{cs['maxsize']} intrări · "
+                       f"{cs['hits']} hit / {cs['misses']} miss ({cs['hit_rate']:.0%}) · {cs['evictions']} evacuări")
+
+# ===== Sidebar: metrici per etapă (doar cu PKR_METRICS=1) =====
+stop_profiler()  # sfârșitul rerun-ului profilat (panoul de mai jos e deja în afara lui)
+if metrics.ENABLED:
+    with st.sidebar:
+        with st.expander("Metrici (timp per etapă)"):
+            for name, m in metrics.snapshot().items():
+                st.caption(f"**{name}**: {m['count']} apeluri · medie {m['mean'] * 1000:.2f} ms · "
+                           f"max {m['max'] * 1000:.2f} ms · total {m['total']:.2f} s")
+            st.button("Profilează următorul rerun (cProfile)",
+                      on_click=lambda: st.session_state.update(profile_next=True))
+            if st.session_state.get("profile_report"):
+                st.code(st.session_state.profile_report, language=None)
+
+record_rerun()
@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from holdem.evaluator import (best_of_seven_bruteforce, best_of_seven_with_combo, decode_score, evaluate,
+                              evaluate_5)
+
+SEED = 12345
+HANDS = 5000
+
+
+def _hands(n, k=7, seed=SEED):
+    rng = random.Random(seed)
+    return [rng.sample(range(52), k) for _ in range(n)]
+
+
+def test_seven_card_parity_with_bruteforce():
+    for hand in _hands(HANDS):
+        ref = best_of_seven_bruteforce(hand)
+        got, combo = best_of_seven_with_combo(hand)
+        assert got == ref, hand
+        assert evaluate_5(combo) == ref, (hand, combo)
+
+
+@pytest.mark.parametrize("k", [5, 6])
+def test_five_and_six_card_parity(k):
+    for hand in _hands(HANDS // 2, k, SEED + k):
+        assert decode_score(evaluate(hand)) == best_of_seven_bruteforce(hand), hand
+
+
+def test_named_hands():
+    c = lambda r, s: (r - 2) * 4 + s  # rang 2..14, culoare 0..3
+    royal = [c(14, 3), c(13, 3), c(12, 3), c(11, 3), c(10, 3), c(2, 0), c(3, 1)]
+    wheel = [c(14, 0), c(2, 1), c(3, 2), c(4, 3), c(5, 0), c(9, 1), c(13, 2)]
+    assert evaluate(royal) >> 20 == 8 and decode_score(evaluate(royal))[1] == 14
+    assert evaluate(wheel) >> 20 == 4 and decode_score(evaluate(wheel)) == best_of_seven_bruteforce(wheel)
+
+
+def test_batch_and_incremental_parity():
+    np = pytest.importorskip("numpy")
+    from holdem.batch import evaluate_batch
+    from holdem.incremental import HandCounters
+    hands = _hands(2000, seed=SEED + 7)
+    ref = [evaluate(h) for h in hands]
+    assert evaluate_batch(np.asarray(hands)).tolist() == ref
+    assert [HandCounters(h).score() for h in hands] == ref
@@ -0,0 +1,84 @@
+import threading
+
+from holdem.game import new_hand_state
+from holdem.history import HandLog, replay_state
+
+
+def _deal(i, n=6):
+    return new_hand_state(n, 1 + i % n, seed=i)
+
+
+def test_roundtrip(tmp_path):
+    log = HandLog(tmp_path / "hands.pkrh")
+    states = [_deal(i, 2 + i % 9) for i in range(50)]
+    for i, s in enumerate(states): assert log.append(s, i) == i
+    assert len(log) == 50
+    for i, s in enumerate(states):
+        r = log[i]
+        assert (r.seed, r.dealer, r.hands) == (i, s["dealer"], list(s["hands"]))
+        assert replay_state(r)["river"] == s["river"]
+
+
+def test_seed_outside_int64_is_logged_without_seed(tmp_path):
+    log = HandLog(tmp_path / "hands.pkrh")
+    log.append(_deal(0), 99999999999999999999)
+    assert log[0].seed is None
+
+
+def test_append_while_iterating(tmp_path):
+    # un cititor în curs nu trebuie să blocheze remaparea după o scriere
+    log = HandLog(tmp_path / "hands.pkrh")
+    for i in range(5): log.append(_deal(i), i)
+    it = log.iter_values()
+    next(it)
+    log.append(_deal(5), 5)
+    assert len(log) == 6
+    assert sum(1 for _ in it) == 4
+
+
+def test_concurrent_read_append(tmp_path):
+    log = HandLog(tmp_path / "hands.pkrh")
+    log.append(_deal(0), 0)
+    errors, done = [], threading.Event()
+
+    def writer():
+        try:
+            for i in range(1, 300): log.append(_deal(i), i)
+        except Exception as e: errors.append(e)
+        finally: done.set()
+
+    def reader():
+        try:
+            while not done.is_set():
+                for k, (i, values) in enumerate(log.iter_values(batch=16)):
+                    assert values[4] == i
+                    if k % 7 == 0: len(log)
+        except Exception as e: errors.append(e)
+
+    threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(3)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+    assert not errors, errors
+    assert len(log) == 300
+
+
+def test_empty_or_short_file_is_an_empty_log(tmp_path):
+    path = tmp_path / "hands.pkrh"
+    path.write_bytes(b"")
+    log = HandLog(path)
+    assert len(log) == 0 and list(log.iter_values()) == []
+    path.write_bytes(b"PKR")  # antet scris pe jumătate
+    assert len(log) == 0
+    assert log.append(_deal(0), 0) == 0
+    assert len(log) == 1 and log[0].seed == 0
+
+
+def test_append_after_torn_record(tmp_path):
+    path = tmp_path / "hands.pkrh"
+    log = HandLog(path)
+    for i in range(3): log.append(_deal(i), i)
+    with open(path, "ab") as f: f.write(b"\x00" * 17)  # ultima scriere întreruptă
+    assert len(log) == 3
+    assert log.append(_deal(3), 3) == 3
+    fresh = HandLog(path)
+    assert [r.seed for r in fresh.iter_records()] == [0, 1, 2, 3]
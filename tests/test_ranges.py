@@ -0,0 +1,41 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from holdem.cards import cards_to_ints
+from holdem.ranges import parse_range, range_equity, range_size
+
+
+@pytest.mark.parametrize("text, combos", [
+    ("QQ+", 18), ("AKs", 4), ("A5s-A2s", 16), ("ATo+", 48), ("99-66, AK", 24 + 16),
+    ("AhKh", 1), ("qq+, ak, 109s", 18 + 16 + 4), ("AKs, AKs:0", 0), ("T9s", 4),
+])
+def test_combo_counts(text, combos):
+    assert len(parse_range(text).combos) == combos
+
+
+@pytest.mark.parametrize("text, weight", [("KQo:0.10", 0.10), ("AKs:0.105", 0.105), ("A10o:1", 1.0)])
+def test_weights_with_ten(text, weight):
+    r = parse_range(text)
+    assert len(r.combos) and set(r.weights.tolist()) == {weight}
+
+
+@pytest.mark.parametrize("text", ["AKs:1.5", "AKs:x", "AXs", "QQ-AKs"])
+def test_invalid(text):
+    with pytest.raises(ValueError):
+        parse_range(text)
+
+
+def test_range_size_with_dead_cards():
+    r = parse_range("QQ+, AKs, KQo:0.5")
+    assert range_size(r) == 18 + 4 + 6
+    assert range_size(r, cards_to_ints(["A♠", "A♥"])) == 18 + 4 + 6 - 5 - 2
+
+
+def test_exact_matches_monte_carlo():
+    hero = tuple(cards_to_ints(["A♠", "A♥"]))
+    board = tuple(cards_to_ints(["K♣", "7♦", "2♠"]))
+    ex = range_equity(hero, ["QQ+, AKs, KQo:0.5"], board)
+    mc = range_equity(hero, ["QQ+, AKs, KQo:0.5"], board, samples=50_000, seed=2, exact_limit=0)
+    assert ex.exact and not mc.exact
+    assert abs(ex.equity - mc.equity) < 0.015
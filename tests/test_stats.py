@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from holdem.evaluator import decode_score, evaluate
+from holdem.game import new_hand_state, next_dealer
+from holdem.stats import SHARE_UNIT, SessionStats, legend_ids
+from holdem.texture import score_to_legend_ids
+
+
+def _hands(n, seed=3):
+    rng = random.Random(seed)
+    dealer = 1
+    for _ in range(n):
+        players = rng.randint(2, 10)
+        dealer = min(dealer, players)
+        s = new_hand_state(players, dealer, rng=rng)
+        board = s["flop"] + (s["turn"], s["river"])
+        yield dealer, [evaluate(h + board) for h in s["hands"]]
+        dealer = next_dealer(dealer, players)
+
+
+def test_legend_ids_match_texture():
+    scores = [sc for _, row in _hands(500) for sc in row]
+    royal = evaluate([48, 44, 40, 36, 32])  # A K Q J T ♣
+    for sc, lid in zip(scores + [royal], legend_ids(scores + [royal]).tolist()):
+        assert {lid} == score_to_legend_ids(decode_score(sc))
+
+
+def test_counts_against_reference_and_merge():
+    stats, parts = SessionStats(), [SessionStats(), SessionStats()]
+    wins, splits, share = [0] * 10, [0] * 10, [0] * 10
+    for i, (dealer, row) in enumerate(_hands(1500)):
+        stats.add(dealer, row)
+        parts[i % 2].add(dealer, row)
+        best = max(row)
+        winners = [j for j, sc in enumerate(row) if sc == best]
+        for j in winners:
+            (wins if len(winners) == 1 else splits)[j] += 1
+            share[j] += SHARE_UNIT // len(winners)
+    assert stats.hands == 1500
+    assert (stats.seat_wins.tolist(), stats.seat_splits.tolist(), stats.seat_share.tolist()) == (wins, splits, share)
+    assert int(stats.pos_hands.sum()) == int(stats.seat_hands.sum())
+    assert parts[0].merge(parts[1]) == stats
+    assert SessionStats.from_dict(stats.to_dict()) == stats
@@ -0,0 +1,26 @@
+import random
+
+from holdem.texture import legend_possibles_bruteforce, legend_possibles_on_river
+
+SEED = 7
+
+
+def _boards(n, seed=SEED):
+    # board-uri aleatoare plus board-uri „grele”: multe cărți de aceeași culoare / același rang
+    rng = random.Random(seed)
+    boards = [tuple(rng.sample(range(52), 5)) for _ in range(n)]
+    for _ in range(n):
+        s = rng.randrange(4)
+        suited = rng.sample([r * 4 + s for r in range(13)], rng.randint(3, 5))
+        rest = rng.sample([c for c in range(52) if c not in suited], 5 - len(suited))
+        boards.append(tuple(suited + rest))
+        r = rng.randrange(13)
+        paired = rng.sample([r * 4 + k for k in range(4)], rng.randint(2, 4))
+        rest = rng.sample([c for c in range(52) if c not in paired], 5 - len(paired))
+        boards.append(tuple(paired + rest))
+    return boards
+
+
+def test_river_possibles_match_bruteforce():
+    for b in _boards(60):
+        assert legend_possibles_on_river(b) == legend_possibles_bruteforce(b), b